@@ -1,12 +1,34 @@
 # https://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#listener-version-3
 import os
-import json
+import logging
+import threading
+import time
+from collections import deque
+
 import redis
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _dumps(event: dict) -> bytes:
+        return json.dumps(event).encode()
+
+
+logger = logging.getLogger(__name__)
+
 
 class RobotRedisListener:
     ROBOT_LISTENER_API_VERSION = 3
-    
+    # Events are published from a background thread in pipelined batches.
+    # When the queue is full the oldest event is discarded.
+    QUEUE_SIZE = 10000
+    BATCH_SIZE = 500
+    BATCH_WINDOW = 0.02
+    DROP_WARNING_INTERVAL = 60
+
     def __init__(self, host=os.getenv('REDIS_HOST', 'localhost'), port=os.getenv('REDIS_PORT', 6379), channel='robot_events'):
         # uri passed by robot: e.g. --listener robot_event_listener.py:localhost:6379
         self.number_of_tests = None
@@ -16,43 +38,109 @@ class RobotRedisListener:
         self.port = port
         self.channel = channel
         self.connected = False
-        self._r = redis.Redis(host=self.host, port=self.port, decode_responses=True)
+        self._channel_bytes = channel.encode()
+        # The main thread only pings; the publisher thread does all the publishing
+        pool = redis.ConnectionPool(host=self.host, port=self.port, max_connections=2)
+        self._r = redis.Redis(connection_pool=pool)
         try:
             self._r.ping()
             self.connected = True
         except redis.ConnectionError:
-            print(f"Could not connect to Redis at {self.host}:{self.port}")
+            logger.warning("Could not connect to Redis at %s:%s", self.host, self.port)
+        self._queue = deque(maxlen=self.QUEUE_SIZE)
+        self._queue_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closing = False
+        self._dropped = 0
+        self._last_drop_warning = 0.0
+        self._publisher = threading.Thread(target=self._drain, daemon=True)
+        if self.connected:
+            self._publisher.start()
 
     def _pub(self, event: dict):
-        if self.connected:
-            self._r.publish(self.channel, json.dumps(event))
+        if not self.connected:
+            return
+        warn = False
+        with self._queue_lock:
+            # A full deque discards the oldest event on append
+            if len(self._queue) == self.QUEUE_SIZE:
+                self._dropped += 1
+                dropped = self._dropped
+                now = time.monotonic()
+                if now - self._last_drop_warning > self.DROP_WARNING_INTERVAL:
+                    self._last_drop_warning = now
+                    warn = True
+            self._queue.append(event)
+        self._wakeup.set()
+        if warn:
+            logger.warning("Redis publish queue is full, %d oldest events dropped so far", dropped)
+
+    def _take_batch(self) -> list:
+        """Removes up to BATCH_SIZE events from the queue."""
+        with self._queue_lock:
+            count = min(len(self._queue), self.BATCH_SIZE)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _drain(self):
+        """Publishes queued events in pipelined batches until the listener is closed."""
+        while True:
+            self._wakeup.wait()
+            if not self._closing:
+                # Give a burst of events a moment to accumulate into one batch
+                time.sleep(self.BATCH_WINDOW)
+            self._wakeup.clear()
+            while batch := self._take_batch():
+                pipe = self._r.pipeline(transaction=False)
+                for event in batch:
+                    pipe.publish(self._channel_bytes, _dumps(event))
+                try:
+                    pipe.execute()
+                except redis.RedisError as e:
+                    logger.warning("Could not publish events to Redis: %s", e)
+            if self._closing:
+                return
+
+    def close(self):
+        """Flushes pending events when Robot Framework finishes the execution."""
+        if self._publisher.is_alive():
+            self._closing = True
+            self._wakeup.set()
+            self._publisher.join(timeout=5)
+
+    def _event(self, kind: str, action: str, lineno: int, result) -> dict:
+        """Builds the event payload directly from the result attributes."""
+        start_time = result.start_time
+        return {
+            'progress': self.progress,
+            'lineno': lineno,
+            'type': kind,
+            'action': action,
+            'name': result.name,
+            'status': result.status,
+            'start_time': start_time.isoformat() if start_time else None,
+            'elapsed_time': result.elapsed_time.total_seconds(),
+        }
 
     def start_suite(self, data, result):
         self.number_of_tests = len(data.tests)
-        result = result.to_dict()
-        self._pub({'progress': self.progress, 'lineno': -1, 'type': 'suite', 'action': 'start', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('suite', 'start', -1, result))
 
     def end_suite(self, data, result):
-        result = result.to_dict()
-        self._pub({'progress': self.progress, 'lineno': -1, 'type': 'suite', 'action': 'end', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('suite', 'end', -1, result))
 
     def start_keyword(self, data, result):
-        result = result.to_dict()
-        self._pub({'progress': self.progress, 'lineno': data.lineno, 'type': 'keyword', 'action': 'start', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('keyword', 'start', data.lineno, result))
 
     def end_keyword(self, data, result):
-        result = result.to_dict()
-        self._pub({'progress': self.progress, 'lineno': data.lineno, 'type': 'keyword', 'action': 'end', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('keyword', 'end', data.lineno, result))
 
     def start_test(self, data, result):
-        result = result.to_dict()
-        self._pub({'progress': self.progress, 'lineno': data.lineno, 'type': 'test', 'action': 'start', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('test', 'start', data.lineno, result))
 
     def end_test(self, data, result):
-        result = result.to_dict()
         self.number_of_tests_run += 1
         self.progress = self.number_of_tests_run / self.number_of_tests if self.number_of_tests else 0
-        self._pub({'progress': self.progress, 'lineno': data.lineno, 'type': 'test', 'action': 'end', 'name': result['name'], 'status': result['status'], 'start_time': result['start_time'], 'elapsed_time': result['elapsed_time']})
+        self._pub(self._event('test', 'end', data.lineno, result))
 
     def log_message(self, message):
         self._pub({'progress': self.progress, 'type': 'message', 'name': str(message)})
\ No newline at end of file
@@ -1,3 +1,4 @@
 from adapters.base import ProtocolAdapter
 from adapters.gpib_adapter import PrologixGPIBEthernet
-from adapters.pyvisa_adapter import PyVisaAdapter
\ No newline at end of file
+from adapters.async_gpib_adapter import AsyncPrologixGPIBEthernet
+from adapters.pyvisa_adapter import PyVisaAdapter, AsyncPyVisaAdapter
\ No newline at end of file
@@ -0,0 +1,171 @@
+import asyncio
+import socket
+
+from adapters.base import ProtocolAdapter
+from adapters.gpib_adapter import PrologixGPIBEthernet, _SETUP, _READ_EOI
+
+
+class AsyncPrologixGPIBEthernet(ProtocolAdapter):
+    """
+    An asyncio protocol adapter for Prologix GPIB-Ethernet devices.
+
+    The socket is driven by the event loop, so instruments behind different
+    controllers can be queried concurrently from a single thread:
+    | adapters = [AsyncPrologixGPIBEthernet(host, 2) for host in hosts]
+    | await asyncio.gather(*(adapter.connect() for adapter in adapters))
+    | readings = await asyncio.gather(*(adapter.ask('TARM SGL') for adapter in adapters))
+
+    Unlike PrologixGPIBEthernet, each adapter owns its TCP connection, and a
+    controller usually accepts only one. Use one adapter per controller, and
+    not together with a PrologixGPIBEthernet on the same controller. Change
+    its address with set_address() to talk to several instruments on the
+    same bus. Their commands then share the bus like any other GPIB adapter.
+    """
+
+    def __init__(self, host: str, address: int, prologix_read_timeout: float = 1.0, socket_read_timeout: float = 1.0):
+        """
+        Initialize the adapter. The connection is opened by connect().
+
+        Args:
+            host (str): The hostname or IP address of the Prologix GPIB-Ethernet controller.
+            address (int): The GPIB address of the device to communicate with.
+            prologix_read_timeout (float, optional): Timeout for Prologix read operations in seconds. Defaults to 1.0.
+            socket_read_timeout (float, optional): Timeout for socket read operations in seconds. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the Prologix read timeout is greater than the socket read timeout,
+                        or if the Prologix read timeout is outside the range [0.001, 3] seconds.
+        """
+        super().__init__(address)
+        self.host = host
+        self.socket = None
+        self.prologix_read_timeout = prologix_read_timeout
+        self.socket_read_timeout = socket_read_timeout
+        self._address_bytes = PrologixGPIBEthernet._address_command(address)
+        self._rbuf = bytearray()
+        self._lock = asyncio.Lock()
+
+        if self.prologix_read_timeout > self.socket_read_timeout:
+            raise ValueError('Prologix read timeout must be less than socket read timeout')
+        if self.prologix_read_timeout < 0.001 or self.prologix_read_timeout > 3:
+            raise ValueError('Timeout must be >= 1ms and <= 3s')
+
+    async def connect(self) -> None:
+        """
+        Connect to the Prologix GPIB-Ethernet controller and perform initial setup.
+        """
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setblocking(False)
+        await asyncio.wait_for(loop.sock_connect(sock, (self.host, PrologixGPIBEthernet.PORT)), self.socket_read_timeout)
+        self.socket = sock
+        read_timeout = f'++read_tmo_ms {int(self.prologix_read_timeout * 1000)}\n'.encode('ascii')
+        await self._send_bytes(_SETUP + read_timeout + self._address_bytes)
+
+    async def close(self) -> None:
+        """
+        Close the connection to the Prologix GPIB-Ethernet controller.
+        """
+        if self.socket is None:
+            return
+        async with self._lock:
+            self.socket.close()
+            self.socket = None
+            self._rbuf.clear()
+
+    async def write(self, command: str) -> None:
+        """
+        Write a command to the device.
+
+        Args:
+            command (str): The command to send to the device.
+        """
+        async with self._lock:
+            await self._send_bytes(f'{command}\n'.encode('ascii'))
+
+    async def read(self, buffer_size: int = 1024) -> str:
+        """
+        Read a response from the device.
+
+        Args:
+            buffer_size (int, optional): The number of bytes to read from the device. Defaults to 1024.
+
+        Returns:
+            str: The response from the device.
+        """
+        async with self._lock:
+            await self._send_bytes(_READ_EOI)
+            return await self._recv(buffer_size)
+
+    async def ask(self, command: str, buffer_size: int = 1024) -> str:
+        """
+        Send a command to the device and read the response.
+
+        Args:
+            command (str): The command to send to the device.
+            buffer_size (int, optional): The number of bytes to read from the device. Defaults to 1024.
+
+        Returns:
+            str: The response from the device.
+        """
+        async with self._lock:
+            await self._send_bytes(f'{command}\n'.encode('ascii') + _READ_EOI)
+            return await self._recv(buffer_size)
+
+    async def set_address(self, primary: int, secondary: int = None) -> None:
+        """
+        Set the primary (and optionally secondary) GPIB address.
+
+        Args:
+            primary (int): The primary GPIB address (0-30).
+            secondary (int, optional): The secondary GPIB address (0-15). Defaults to None.
+        """
+        async with self._lock:
+            self.address = primary
+            self._address_bytes = PrologixGPIBEthernet._address_command(primary, secondary)
+            await self._send_bytes(self._address_bytes)
+
+    async def _send_bytes(self, data: bytes) -> None:
+        """
+        Send encoded, newline-terminated data to the Prologix GPIB-Ethernet controller.
+
+        Args:
+            data (bytes): The encoded commands or data to send.
+        """
+        await asyncio.get_running_loop().sock_sendall(self.socket, data)
+
+    async def _recv(self, byte_num: int = 1024) -> str:
+        """
+        Receive one response line from the Prologix GPIB-Ethernet controller.
+
+        Args:
+            byte_num (int, optional): The maximum number of bytes to return.
+
+        Returns:
+            str: The received data as a string.
+
+        Raises:
+            TimeoutError: If no data arrives before the socket read timeout.
+        """
+        loop = asyncio.get_running_loop()
+        end = self._rbuf.find(b'\n')
+        while end < 0 and len(self._rbuf) < byte_num:
+            try:
+                chunk = await asyncio.wait_for(
+                    loop.sock_recv(self.socket, PrologixGPIBEthernet.RECV_CHUNK_SIZE),
+                    self.socket_read_timeout
+                )
+            except asyncio.TimeoutError:
+                if not self._rbuf:
+                    raise
+                break
+            if not chunk:
+                break
+            self._rbuf += chunk
+            end = self._rbuf.find(b'\n')
+        size = end + 1 if 0 <= end < byte_num else min(len(self._rbuf), byte_num)
+        line = bytes(self._rbuf[:size])
+        del self._rbuf[:size]
+        return line.strip().decode('ascii')
@@ -3,6 +3,12 @@ class ProtocolAdapter:
     Base class for protocol adapters.
     This class defines the interface for the protocol adapter.
     """
+
+    __slots__ = ('address',)
+
+    # Whether queries can run concurrently with other instruments.
+    # False for transports that share a bus, such as GPIB.
+    supports_concurrent: bool = False
     
     def __init__(self, address: int):
         """
@@ -1,14 +1,59 @@
+import atexit
+import threading
+import time
+from collections import deque
+
+import can
 import canopen
 
 
+class RingBufferListener(can.Listener):
+    """
+    Bounded receive buffer fed by the network notifier thread.
+    When the buffer is full the oldest frame is discarded.
+    """
+
+    def __init__(self, size: int):
+        self._buffer = deque(maxlen=size)
+        self._ready = threading.Event()
+
+    def on_message_received(self, msg: can.Message) -> None:
+        self._buffer.append(msg)
+        self._ready.set()
+
+    def get_message(self, timeout: float = 1.0) -> can.Message | None:
+        """
+        Pop the oldest buffered frame, waiting up to `timeout` seconds for one to arrive.
+
+        Returns:
+            can.Message | None: The frame, or None if the timeout expired.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._ready.clear()
+            try:
+                return self._buffer.popleft()
+            except IndexError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._ready.wait(remaining):
+                return None
+
+
 class CANAdapter:
     """
     Singleton CAN adapter class.
     Only one instance of CANAdapter will exist at any time.
     Repeated instantiations will return the same object.
     To reinitialize with new parameters, call shutdown() first.
+
+    The connection is closed explicitly with shutdown(), by using the
+    adapter as a context manager, or at interpreter exit:
+    | with CANAdapter(host) as adapter:
+    |     adapter.send_message(0x123, bytes([1]))
     """
     _instance = None
+    RX_BUFFER_SIZE = 1024
 
     def __new__(cls, host: str):
         if cls._instance is None:
@@ -21,15 +66,37 @@ class CANAdapter:
             return
         self.network = canopen.Network()
         self.network.connect(host , interface='remote')
+        # Reused for every outgoing frame to avoid allocating a new message per send
+        self._tx = can.Message(arbitration_id=0, data=bytes(8), is_extended_id=False)
+        # Frames are pulled off the bus by the network notifier thread as they arrive
+        self._rx = RingBufferListener(self.RX_BUFFER_SIZE)
+        self.network.notifier.add_listener(self._rx)
         self._initialized = True
+        atexit.register(self.shutdown)
 
-    # def send_message(self, message_id: int, data: bytes):
-    #     self.bus.send(can.Message(arbitration_id=message_id, data=data, is_extended_id=False))
+    def send_message(self, message_id: int, data: bytes):
+        with self.network.send_lock:
+            self._tx.arbitration_id = message_id
+            self._tx.data = data
+            self._tx.dlc = len(data)
+            self.network.bus.send(self._tx)
+
+    def recv(self, timeout: float = 1.0) -> can.Message | None:
+        """
+        Return the oldest received frame, or None if none arrives within `timeout` seconds.
+        """
+        return self._rx.get_message(timeout)
 
     def shutdown(self):
+        if not self._initialized:
+            return
+        atexit.unregister(self.shutdown)
         self.network.disconnect()
         CANAdapter._instance = None
         self._initialized = False
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.shutdown()
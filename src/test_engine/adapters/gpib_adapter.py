@@ -1,9 +1,67 @@
 import socket
+import threading
 from typing import Literal
 
 from adapters.base import ProtocolAdapter
 
 
+# Static controller commands, encoded once at import time
+_SETUP = b'++mode 1\n++auto 0\n++eos 0\n++eoi 1\n'
+_READ_EOI = b'++read eoi\n'
+_READ = b'++read\n'
+_ADDR = b'++addr'
+_ADDR_QUERY = b'++addr\n'
+_MODE = b'++mode\n'
+_AUTO = b'++auto\n'
+_READ_TMO = b'++read_tmo_ms\n'
+_EOI = b'++eoi\n'
+_EOS = b'++eos\n'
+_IFC = b'++ifc\n'
+_CLR = b'++clr\n'
+_LLO = b'++llo\n'
+_LOC = b'++loc\n'
+_RST = b'++rst\n'
+_VER = b'++ver\n'
+_HELP = b'++help\n'
+_SRQ = b'++srq\n'
+_SPOLL = b'++spoll\n'
+_STATUS = b'++status\n'
+_TRG = b'++trg\n'
+
+
+class _SharedConnection:
+    """
+    A TCP connection to a Prologix controller, shared by every adapter
+    that talks to an instrument behind the same controller.
+    """
+
+    __slots__ = (
+        'socket', 'socket_timeout', 'read_timeout',
+        'lock', 'refcount', 'selected', 'wbuf', 'rbuf', 'rpos'
+    )
+
+    def __init__(self, sock: socket.socket, socket_timeout: float):
+        self.socket = sock
+        # Timeout currently set on the socket
+        self.socket_timeout = socket_timeout
+        # Encoded ++read_tmo_ms command currently set on the controller
+        self.read_timeout = None
+        self.lock = threading.RLock()
+        self.refcount = 0
+        # Encoded ++addr command of the instrument currently selected on the controller
+        self.selected = None
+        # Outgoing bytes not yet handed to the socket
+        self.wbuf = bytearray()
+        # Received bytes, of which those before rpos were already returned to a caller
+        self.rbuf = bytearray()
+        self.rpos = 0
+
+
+# Open controller connections, keyed by (host, port)
+_CONNECTIONS: dict[tuple[str, int], _SharedConnection] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
 class PrologixGPIBEthernet(ProtocolAdapter):
     """
     A protocol adapter for Prologix GPIB-Ethernet devices.
@@ -12,7 +70,16 @@ class PrologixGPIBEthernet(ProtocolAdapter):
     over GPIB using a Prologix GPIB-Ethernet controller.
     """
 
+    __slots__ = (
+        'host', 'socket', 'prologix_read_timeout', 'socket_read_timeout',
+        '_connection', '_lock', '_address_bytes', '_read_timeout_bytes',
+    )
+
     PORT = 1234
+    SOCKET_BUFFER_SIZE = 256 * 1024
+    RECV_CHUNK_SIZE = 64 * 1024
+    # Consumed bytes are only removed from the receive buffer past this size
+    RECV_COMPACT_SIZE = 32 * 1024
 
     def __init__(self, host: str, address: int, prologix_read_timeout: float = 1.0, socket_read_timeout: float = 1.0):
         """
@@ -30,31 +97,115 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         """
         super().__init__(address)
         self.host = host
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        self.socket = None
         self.prologix_read_timeout = prologix_read_timeout
         self.socket_read_timeout = socket_read_timeout
+        self._connection = None
+        self._lock = None
+        self._address_bytes = self._address_command(address)
+        self._read_timeout_bytes = self._read_timeout_command(prologix_read_timeout)
 
         if self.prologix_read_timeout > self.socket_read_timeout:
             raise ValueError('Prologix read timeout must be less than socket read timeout')
         if self.prologix_read_timeout < 0.001 or self.prologix_read_timeout > 3:
             raise ValueError('Timeout must be >= 1ms and <= 3s')
 
-        self.socket.settimeout(self.socket_read_timeout)
         self.connect()
 
     def connect(self) -> None:
         """
         Connect to the Prologix GPIB-Ethernet controller and perform initial setup.
+
+        Adapters for instruments behind the same controller share a single
+        TCP connection. The controller is only set up when the connection is
+        first opened, and is shared only once that setup succeeded. Each
+        adapter keeps its own timeouts, which are applied to the connection
+        whenever they differ from those of the adapter that used it last.
+        Does nothing if this adapter is already connected.
+        """
+        key = (self.host, self.PORT)
+        with _CONNECTIONS_LOCK:
+            if self._connection is not None:
+                return
+            connection = _CONNECTIONS.get(key)
+            if connection is not None:
+                self._attach(connection)
+                return
+            connection = _SharedConnection(self._open_socket(), self.socket_read_timeout)
+            self._attach(connection)
+            try:
+                self._setup()
+            except BaseException:
+                self._connection = None
+                connection.socket.close()
+                raise
+            _CONNECTIONS[key] = connection
+
+    def _attach(self, connection: _SharedConnection) -> None:
+        """
+        Use the given shared connection for this adapter.
+        """
+        connection.refcount += 1
+        self._connection = connection
+        self._lock = connection.lock
+        self.socket = connection.socket
+
+    def _get_connection(self) -> _SharedConnection:
+        """
+        Return the shared connection of this adapter.
+
+        Raises:
+            ConnectionError: If the adapter is not connected.
+        """
+        connection = self._connection
+        if connection is None:
+            raise ConnectionError(f'Not connected to the Prologix controller at {self.host}')
+        return connection
+
+    def _open_socket(self) -> socket.socket:
+        """
+        Open and configure a TCP socket to the Prologix GPIB-Ethernet controller.
         """
-        self.socket.connect((self.host, self.PORT))
-        self._setup()
-        self.set_address(self.address)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+        sock.settimeout(self.socket_read_timeout)
+        sock.connect((self.host, self.PORT))
+        return sock
 
     def close(self) -> None:
         """
         Close the connection to the Prologix GPIB-Ethernet controller.
-        """
-        self.socket.close()
+
+        The shared connection is only closed once the last adapter using it
+        is closed. Pending incoming bytes are then drained with a short timeout
+        so the close does not stall for the full socket read timeout.
+        """
+        with _CONNECTIONS_LOCK:
+            connection = self._connection
+            if connection is None:
+                return
+            self._connection = None
+            self.socket = None
+            connection.refcount -= 1
+            if connection.refcount > 0:
+                return
+            del _CONNECTIONS[(self.host, self.PORT)]
+        sock = connection.socket
+        try:
+            # Write side only: the receive side stays open for the drain below
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+        sock.settimeout(0.001)
+        try:
+            while sock.recv(4096):
+                pass
+        except OSError:
+            pass
+        sock.close()
 
     def write(self, command: str) -> None:
         """
@@ -75,8 +226,9 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The response from the device.
         """
-        self._send('++read eoi')
-        return self._recv(buffer_size)
+        with self._lock:
+            self._send_bytes(_READ_EOI, flush=False)
+            return self._recv(buffer_size)
 
     def ask(self, command: str, buffer_size: int = 1024) -> str:
         """
@@ -89,41 +241,204 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The response from the device.
         """
-        self.write(command)
-        return self.read(buffer_size)
+        with self._lock:
+            # The command and the ++read go out in a single send
+            self._send_bytes(f'{command}\n'.encode('ascii') + _READ_EOI)
+            return self._recv(buffer_size)
+
+    def ask_many(self, command: str, count: int, buffer_size: int = 1024) -> list[str]:
+        """
+        Send the same query `count` times and read all the responses.
+
+        All the queries are sent in a single write and the responses are read
+        back in order, so the readings cost about one network round trip
+        instead of one per reading.
+
+        Args:
+            command (str): The command to send to the device.
+            count (int): The number of times to send the command.
+            buffer_size (int, optional): The number of bytes to read per response. Defaults to 1024.
+
+        Returns:
+            list[str]: The responses from the device.
+        """
+        with self._lock:
+            self._send_bytes((f'{command}\n'.encode('ascii') + _READ_EOI) * count)
+            return [self._recv(buffer_size) for _ in range(count)]
+
+    def flush(self) -> None:
+        """
+        Send any buffered commands to the Prologix GPIB-Ethernet controller.
+        """
+        with self._lock:
+            wbuf = self._get_connection().wbuf
+            if wbuf:
+                self.socket.sendall(wbuf)
+                wbuf.clear()
+
+    def _send(self, *values: str, flush: bool = True) -> None:
+        """
+        Send one or more commands or data to the Prologix GPIB-Ethernet controller.
+
+        Multiple values are joined with newlines and sent in a single write.
+
+        Args:
+            *values (str): The commands or data to send.
+            flush (bool, optional): Send immediately instead of leaving the data buffered
+                                    until the next flush or read. Defaults to True.
+        """
+        # One join and one encode, the trailing '' adds the final newline
+        encoded_value = '\n'.join((*values, '')).encode('ascii')
+        self._send_bytes(encoded_value, flush)
 
-    def _send(self, value: str) -> None:
+    def _send_bytes(self, data: bytes, flush: bool = True) -> None:
         """
-        Send a command or data to the Prologix GPIB-Ethernet controller.
+        Send already encoded, newline-terminated data to the Prologix GPIB-Ethernet controller.
+
+        Args:
+            data (bytes): The encoded commands or data to send.
+            flush (bool, optional): Send immediately instead of leaving the data buffered
+                                    until the next flush or read. Defaults to True.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            wbuf = connection.wbuf
+            # Select this instrument and its read timeout first if another adapter used the controller last
+            if connection.selected != self._address_bytes:
+                wbuf += self._address_bytes
+                connection.selected = self._address_bytes
+            if connection.read_timeout != self._read_timeout_bytes:
+                wbuf += self._read_timeout_bytes
+                connection.read_timeout = self._read_timeout_bytes
+            wbuf += data
+            if flush:
+                self.flush()
+
+    def _query(self, command: bytes, byte_num: int = 1024) -> str:
+        """
+        Send a command to the Prologix GPIB-Ethernet controller and receive its response.
 
         Args:
-            value (str): The command or data to send.
+            command (bytes): The encoded, newline-terminated command to send.
+            byte_num (int, optional): The maximum number of bytes to read.
+
+        Returns:
+            str: The received data as a string.
         """
-        encoded_value = f'{value}\n'.encode('ascii')
-        self.socket.send(encoded_value)
+        return self._query_bytes(command, byte_num).decode('ascii')
+
+    def _query_bytes(self, command: bytes, byte_num: int = 1024) -> bytes:
+        """
+        Same as `_query`, but returns the raw response without decoding it.
+        """
+        with self._lock:
+            self._send_bytes(command, flush=False)
+            return self._recv_bytes(byte_num)
 
     def _recv(self, byte_num: int = 1024) -> str:
         """
-        Receive data from the Prologix GPIB-Ethernet controller.
+        Receive one response line from the Prologix GPIB-Ethernet controller.
 
         Args:
-            byte_num (int, optional): The number of bytes to read.
+            byte_num (int, optional): The maximum number of bytes to return.
 
         Returns:
             str: The received data as a string.
         """
-        value = self.socket.recv(byte_num)
-        return value.decode('ascii').strip()
+        return self._recv_bytes(byte_num).decode('ascii')
+
+    def _recv_bytes(self, byte_num: int = 1024) -> bytes:
+        """
+        Receive one response line from the Prologix GPIB-Ethernet controller,
+        without the surrounding whitespace.
+
+        The socket is read in large chunks into a receive buffer shared by the
+        connection. A response is returned once its line terminator is buffered
+        or `byte_num` bytes have been received, and any bytes after it are kept
+        for the next call.
+
+        Args:
+            byte_num (int, optional): The maximum number of bytes to return.
+
+        Returns:
+            bytes: The received data.
+
+        Raises:
+            socket.timeout: If no data arrives before the socket read timeout.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            if connection.socket_timeout != self.socket_read_timeout:
+                self.socket.settimeout(self.socket_read_timeout)
+                connection.socket_timeout = self.socket_read_timeout
+            self.flush()
+            rbuf = connection.rbuf
+            start = connection.rpos
+            limit = start + byte_num
+            end = rbuf.find(b'\n', start)
+            quickack = True
+            while end < 0 and len(rbuf) < limit:
+                searched = len(rbuf)
+                try:
+                    chunk = self.socket.recv(self.RECV_CHUNK_SIZE)
+                except socket.timeout:
+                    if searched == start:
+                        raise
+                    break
+                if not chunk:
+                    break
+                rbuf += chunk
+                if quickack:
+                    # Once per response is enough, not after every chunk
+                    self._quickack()
+                    quickack = False
+                # Only the new bytes can hold the terminator
+                end = rbuf.find(b'\n', searched)
+            stop = end + 1 if 0 <= end < limit else min(len(rbuf), limit)
+            line = bytes(rbuf[start:stop])
+            if stop == len(rbuf):
+                rbuf.clear()
+                connection.rpos = 0
+            elif stop > self.RECV_COMPACT_SIZE:
+                del rbuf[:stop]
+                connection.rpos = 0
+            else:
+                connection.rpos = stop
+        return line.strip()
+
+    def _quickack(self) -> None:
+        """
+        Re-enable quick ACKs after a read (Linux only), so the controller
+        is not held back by delayed ACKs on the response leg.
+        """
+        if hasattr(socket, 'TCP_QUICKACK'):
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
 
     def _setup(self) -> None:
         """
-        Perform initial setup for the Prologix GPIB-Ethernet controller.
+        Perform initial setup for the Prologix GPIB-Ethernet controller
+        and select the device address, all in a single write.
         """
-        self.set_mode('controller')
-        self.set_auto_read(False)
-        self.set_read_timeout(self.prologix_read_timeout)
-        self.set_eos('crlf')
-        self.set_eoi(True)
+        with self._lock:
+            self.socket.sendall(_SETUP + self._read_timeout_bytes + self._address_bytes)
+            self._connection.read_timeout = self._read_timeout_bytes
+            self._connection.selected = self._address_bytes
+
+    @staticmethod
+    def _address_command(primary: int, secondary: int = None) -> bytes:
+        """
+        Build the encoded ++addr command for the given primary (and optional secondary) address.
+        """
+        if secondary is not None:
+            return b'%s %d %d\n' % (_ADDR, primary, secondary + 96)
+        return b'%s %d\n' % (_ADDR, primary)
+
+    @staticmethod
+    def _read_timeout_command(seconds: float) -> bytes:
+        """
+        Build the encoded ++read_tmo_ms command for the given read timeout in seconds.
+        """
+        return b'++read_tmo_ms %d\n' % int(seconds * 1000)
         
     def set_address(self, primary: int, secondary: int = None) -> None:
         """
@@ -133,10 +448,13 @@ class PrologixGPIBEthernet(ProtocolAdapter):
             primary (int): The primary GPIB address (0-30).
             secondary (int, optional): The secondary GPIB address (0-15). Defaults to None.
         """
-        if secondary is not None:
-            self._send(f'++addr {primary} {secondary + 96}')
-        else:
-            self._send(f'++addr {primary}')
+        self.address = primary
+        self._address_bytes = self._address_command(primary, secondary)
+        with self._lock:
+            connection = self._get_connection()
+            connection.wbuf += self._address_bytes
+            connection.selected = self._address_bytes
+            self.flush()
 
     def get_address(self) -> str:
         """
@@ -145,8 +463,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The currently selected GPIB address.
         """
-        self._send('++addr')
-        return self._recv(64)
+        return self._query(_ADDR_QUERY, 64)
 
     def set_mode(self, mode: Literal['controller', 'device']) -> None:
         """
@@ -167,9 +484,8 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The current mode ('controller' or 'device').
         """
-        self._send('++mode')
         mode_map = {0: 'device', 1: 'controller'}
-        return mode_map[int(self._recv(64))]
+        return mode_map[int(self._query_bytes(_MODE, 64))]
 
     def set_auto_read(self, enabled: bool) -> None:
         """
@@ -187,8 +503,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             bool: True if auto-read is enabled, False otherwise.
         """
-        self._send('++auto')
-        return self._recv(8) == '1'
+        return self._query_bytes(_AUTO, 8) == b'1'
 
     def set_read_timeout(self, seconds: float) -> None:
         """
@@ -197,8 +512,13 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Args:
             seconds (float): The read timeout in seconds.
         """
-        timeout_ms = int(seconds * 1000)
-        self._send(f'++read_tmo_ms {timeout_ms}')
+        self.prologix_read_timeout = seconds
+        self._read_timeout_bytes = self._read_timeout_command(seconds)
+        with self._lock:
+            connection = self._get_connection()
+            connection.wbuf += self._read_timeout_bytes
+            connection.read_timeout = self._read_timeout_bytes
+            self.flush()
 
     def get_read_timeout(self) -> str:
         """
@@ -207,8 +527,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The current read timeout in milliseconds.
         """
-        self._send('++read_tmo_ms')
-        return self._recv(64)
+        return self._query(_READ_TMO, 64)
 
     def set_eoi(self, enabled: bool) -> None:
         """
@@ -226,8 +545,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             bool: True if EOI is enabled, False otherwise.
         """
-        self._send('++eoi')
-        return self._recv(8) == '1'
+        return self._query_bytes(_EOI, 8) == b'1'
 
     def set_eos(self, mode: Literal['crlf', 'cr', 'lf', 'none']) -> None:
         """
@@ -251,9 +569,8 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The current EOS mode ('crlf', 'cr', 'lf', 'none').
         """
-        self._send('++eos')
         eos_map = {0: 'crlf', 1: 'cr', 2: 'lf', 3: 'none'}
-        return eos_map[int(self._recv(64))]
+        return eos_map[int(self._query_bytes(_EOS, 64))]
     
     def set_eot(self, enabled: bool) -> None:
         """
@@ -275,19 +592,19 @@ class PrologixGPIBEthernet(ProtocolAdapter):
 
     def send_ifc(self) -> None:
         """Send Interface Clear (IFC) signal on the GPIB bus."""
-        self._send('++ifc')
+        self._send_bytes(_IFC)
 
     def device_clear(self) -> None:
         """Send device clear (DCL) to the currently addressed GPIB device."""
-        self._send('++clr')
+        self._send_bytes(_CLR)
 
     def disable_local(self) -> None:
         """Disable local keyboard on the instrument (++llo)."""
-        self._send('++llo')
+        self._send_bytes(_LLO)
 
     def enable_local(self) -> None:
         """Enable local keyboard and front panel (++loc)."""
-        self._send('++loc')
+        self._send_bytes(_LOC)
 
     def listen_only_mode(self, enabled: bool) -> None:
         """
@@ -300,7 +617,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
 
     def reset_controller(self) -> None:
         """Reset the Prologix controller (++rst)."""
-        self._send('++rst')
+        self._send_bytes(_RST)
 
     def get_version(self) -> str:
         """
@@ -309,8 +626,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The firmware version of the Prologix adapter.
         """
-        self._send('++ver')
-        return self._recv(64)
+        return self._query(_VER, 64)
 
     def get_help(self) -> str:
         """
@@ -319,8 +635,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             str: The help text showing supported commands.
         """
-        self._send('++help')
-        return self._recv(256)
+        return self._query(_HELP, 256)
 
     def query_srq(self) -> bool:
         """
@@ -329,8 +644,7 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         Returns:
             bool: True if SRQ is active, False otherwise.
         """
-        self._send('++srq')
-        return self._recv(8) == '1'
+        return self._query_bytes(_SRQ, 8) == b'1'
 
     def serial_poll(self, pad: int = None, sad: int = None) -> str:
         """
@@ -342,10 +656,8 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         """
         if pad is not None:
             cmd = f'++spoll {pad}' + (f' {sad + 96}' if sad is not None else '')
-        else:
-            cmd = '++spoll'
-        self._send(cmd)
-        return self._recv(64)
+            return self._query(f'{cmd}\n'.encode('ascii'), 64)
+        return self._query(_SPOLL, 64)
 
     def set_status_byte(self, value: int) -> None:
         """Set the adapter's internal status byte (++status)."""
@@ -353,15 +665,14 @@ class PrologixGPIBEthernet(ProtocolAdapter):
 
     def get_status_byte(self) -> str:
         """Read the current status byte (++status)."""
-        self._send('++status')
-        return self._recv(64)
+        return self._query(_STATUS, 64)
 
     def trigger(self, *addresses: int) -> None:
         """Send GPIB trigger to one or more devices (++trg)."""
         if addresses:
             self._send('++trg ' + ' '.join(map(str, addresses)))
         else:
-            self._send('++trg')
+            self._send_bytes(_TRG)
 
     def read_until(self, mode: str = 'eoi', char_code: int = None) -> str:
         """
@@ -369,10 +680,11 @@ class PrologixGPIBEthernet(ProtocolAdapter):
         - mode: 'eoi' (default) or 'char'
         - char_code: ASCII byte to end reading on (if mode='char')
         """
-        if mode == 'eoi':
-            self._send('++read eoi')
-        elif char_code is not None:
-            self._send(f'++read {char_code}')
-        else:
-            self._send('++read')
-        return self._recv(1024)
+        with self._lock:
+            if mode == 'eoi':
+                self._send_bytes(_READ_EOI, flush=False)
+            elif char_code is not None:
+                self._send(f'++read {char_code}', flush=False)
+            else:
+                self._send_bytes(_READ, flush=False)
+            return self._recv(1024)
@@ -1,4 +1,10 @@
+import asyncio
+import atexit
+import threading
+import weakref
+
 import pyvisa
+from pyvisa.constants import InterfaceType
 from typing import Optional
 
 from adapters import ProtocolAdapter
@@ -11,6 +17,11 @@ class PyVisaAdapter(ProtocolAdapter):
     """
     
     _rm: Optional[pyvisa.ResourceManager] = None
+    # Open resources shared by adapters with the same resource string, timeout and options,
+    # with the number of adapters using each of them
+    _instrument_pool: dict[tuple, pyvisa.Resource] = {}
+    _refcounts: dict[tuple, int] = {}
+    _pool_lock = threading.Lock()
     
     def __init__(self, visa_resource_string: str, backend: str = '@py', read_timeout: int = 10000, **kwargs):
         """
@@ -27,8 +38,19 @@ class PyVisaAdapter(ProtocolAdapter):
         if PyVisaAdapter._rm is None:
             PyVisaAdapter._rm = pyvisa.ResourceManager(backend)
             
-        self.instrument = self._rm.open_resource(self.address, **kwargs)
-        self.instrument.timeout = read_timeout
+        # The timeout is part of the key: setting it on a shared resource
+        # would change it for the other adapters too
+        self._key = (visa_resource_string, read_timeout, tuple(sorted(kwargs.items())))
+        with PyVisaAdapter._pool_lock:
+            instrument = PyVisaAdapter._instrument_pool.get(self._key)
+            if instrument is None:
+                instrument = self._rm.open_resource(self.address, **kwargs)
+                instrument.timeout = read_timeout
+                PyVisaAdapter._instrument_pool[self._key] = instrument
+                PyVisaAdapter._refcounts[self._key] = 0
+            PyVisaAdapter._refcounts[self._key] += 1
+        self.instrument = instrument
+        self.supports_concurrent = self.instrument.interface_type != InterfaceType.gpib
 
     def write(self, command: str) -> None:
         """
@@ -52,5 +74,101 @@ class PyVisaAdapter(ProtocolAdapter):
     def close(self):
         """
         Close the connection to the instrument.
+        The shared resource is only closed once the last adapter using it is closed.
+        Closing an adapter again does nothing.
         """
+        with PyVisaAdapter._pool_lock:
+            key, self._key = self._key, None
+            if key not in PyVisaAdapter._refcounts:
+                return
+            PyVisaAdapter._refcounts[key] -= 1
+            if PyVisaAdapter._refcounts[key] > 0:
+                return
+            del PyVisaAdapter._refcounts[key]
+            del PyVisaAdapter._instrument_pool[key]
         self.instrument.close()
+
+    @classmethod
+    def close_all(cls):
+        """
+        Close every pooled resource, regardless of how many adapters still use it.
+        """
+        with cls._pool_lock:
+            instruments = list(cls._instrument_pool.values())
+            cls._instrument_pool.clear()
+            cls._refcounts.clear()
+        for instrument in instruments:
+            try:
+                instrument.close()
+            except pyvisa.Error:
+                pass
+
+
+class AsyncPyVisaAdapter:
+    """
+    Awaitable wrapper around a PyVisaAdapter, for driving several instruments
+    from one event loop alongside AsyncPrologixGPIBEthernet.
+
+    The blocking PyVISA calls run in worker threads. Instruments on a shared
+    bus (GPIB) are serialized per board, others run concurrently.
+    """
+
+    # Locks of the running event loops (an asyncio.Lock belongs to one loop):
+    # event loop -> {lock key: lock}
+    _locks = weakref.WeakKeyDictionary()
+
+    def __init__(self, visa_resource_string: str, backend: str = '@py', read_timeout: int = 10000, **kwargs):
+        """
+        Initialize the adapter. Arguments are the same as for PyVisaAdapter.
+        """
+        self.adapter = PyVisaAdapter(visa_resource_string, backend, read_timeout, **kwargs)
+        if self.adapter.supports_concurrent:
+            # A lock of its own
+            self._lock_key = ('resource', id(self))
+        else:
+            # One lock per shared bus, keyed by the interface part of the resource string
+            self._lock_key = ('bus', visa_resource_string.split('::')[0])
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        locks = AsyncPyVisaAdapter._locks.setdefault(asyncio.get_running_loop(), {})
+        return locks.setdefault(self._lock_key, asyncio.Lock())
+
+    @property
+    def address(self) -> str:
+        return self.adapter.address
+
+    @property
+    def supports_concurrent(self) -> bool:
+        return self.adapter.supports_concurrent
+
+    async def write(self, command: str) -> None:
+        """
+        Write a command to the device.
+        """
+        async with self._lock:
+            await asyncio.to_thread(self.adapter.write, command)
+
+    async def read(self, buffer_size: int = 1024) -> str:
+        """
+        Read a response from the device.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self.adapter.read, buffer_size)
+
+    async def ask(self, command: str) -> str:
+        """
+        Send a command and read the response.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self.adapter.ask, command)
+
+    async def close(self) -> None:
+        """
+        Close the connection to the instrument.
+        """
+        async with self._lock:
+            await asyncio.to_thread(self.adapter.close)
+
+
+atexit.register(PyVisaAdapter.close_all)
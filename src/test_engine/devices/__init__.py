@@ -1,4 +1,6 @@
 from devices.hp3458a import HP3458A
 from devices.hp53131a import HP53131A
 from devices.hpe4419b import HPE4419B
-from devices.afg2225 import AFG2225
\ No newline at end of file
+from devices.afg2225 import AFG2225
+from devices.async_hp3458a import AsyncHP3458A
+from devices.async_hp3458a import read_all
\ No newline at end of file
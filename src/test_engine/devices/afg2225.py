@@ -1,61 +1,205 @@
+import functools
 import logging
 import time
+from types import MappingProxyType
 
 from pymeasure.instruments import Instrument, Channel, SCPIMixin
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
+from pyvisa.constants import EventType, EventMechanism
+from pyvisa.errors import VisaIOError
+
+from devices.base import TerminationMixin, disable_nagle, enable_low_latency
 
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+# typed: 1, 1.0 and True are equal but format differently, so each type gets its own entry
+@functools.lru_cache(maxsize=1024, typed=True)
+def _strict_range(value, low, high):
+    return strict_range(value, [low, high])
+
+
+def _cached_strict_range(value, values):
+    """
+    Same as pymeasure's strict_range, memoized per value and range so values
+    written repeatedly (e.g. inside a loop) are only checked once.
+    """
+    try:
+        return _strict_range(value, *values)
+    except TypeError:
+        # Unhashable value
+        return strict_range(value, values)
+
+
+def _compound(commands) -> str:
+    """
+    Joins SCPI commands into one compound message. Every command is given its
+    full path, so each is rooted with ':' unless it is a common (*) command.
+    """
+    return ';'.join(c if c.startswith((':', '*')) else f':{c}' for c in commands)
+
+
+class CachedControl:
+    """
+    Wraps an Instrument.control property so the last value read back from the
+    instrument is kept in the channel's `_cache` and returned without a query.
+
+    Only read-back values are cached: setting a value, or any other command
+    that is not a plain query, clears the caches (see AFG2225.write), so the next
+    read shows what the instrument actually applied. Use AFG2225Channel.read_property()
+    with refresh=True to bypass the cache, or disable it with AFG2225(cache_reads=False).
+    """
+
+    def __init__(self, control: property):
+        self.control = control
+        self.__doc__ = control.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, channel, owner=None):
+        if channel is None:
+            return self
+        if not channel.parent.cache_reads:
+            return self.control.__get__(channel, owner)
+        cache = channel._cache
+        if self.name not in cache:
+            # Only stored once the query succeeded
+            cache[self.name] = self.control.__get__(channel, owner)
+        return cache[self.name]
+
+    def __set__(self, channel, value):
+        # The write clears the cached values, see AFG2225.write
+        self.control.__set__(channel, value)
+
+
+class FastControl(CachedControl):
+    """
+    CachedControl that sends new values itself instead of through the wrapped
+    Instrument.control. The set command is formatted with the channel id once per
+    channel and its bound `%` operator is kept, so setting a value only validates,
+    processes and formats it. Takes the same arguments as Instrument.control.
+    """
+
+    def __init__(self, get_command, set_command, docs, validator=lambda v, vs: v,
+                 values=(), set_process=lambda v: v, **kwargs):
+        super().__init__(Instrument.control(
+            get_command, set_command, docs,
+            validator=validator, values=values, set_process=set_process, **kwargs
+        ))
+        self.set_command = set_command
+        self.validator = validator
+        self.values = values
+        self.set_process = set_process
+
+    def __set__(self, channel, value):
+        formatter = channel._formatters.get(self.name)
+        if formatter is None:
+            formatter = channel.insert_id(self.set_command).__mod__
+            channel._formatters[self.name] = formatter
+        # The id is already inserted, so write through the parent to skip Channel.insert_id.
+        # The write clears the cached values, see AFG2225.write
+        channel.parent.write(formatter(self.set_process(self.validator(value, self.values))))
+
+
 class AFG2225Channel(Channel):
     """
     Represents a single channel of the GW Instek AFG-2225 Function Generator.
     """
 
-    # Mappings for shape and load properties
-    SHAPES = {
+    # Mappings for shape and load properties, read-only so they cannot
+    # drift from their reverse mappings
+    SHAPES = MappingProxyType({
         'sine': 'SIN', 'square': 'SQU', 'ramp': 'RAMP',
         'pulse': 'PULS', 'noise': 'NOIS', 'user': 'USER'
-    }
-    LOADS = {'50ohm': 'DEF', 'highZ': 'INF'}
+    })
+    LOADS = MappingProxyType({'50ohm': 'DEF', 'highZ': 'INF'})
+    # Reverse mappings, so a reply is mapped back with a dict lookup
+    # instead of map_values searching the mapping on every read
+    _SHAPES_INV = MappingProxyType({v: k for k, v in SHAPES.items()})
+    _LOADS_INV = MappingProxyType({v: k for k, v in LOADS.items()})
+    FREQUENCY_RANGE = [1e-6, 25e6]
+    AMPLITUDE_RANGE = [0.001, 10.0]
+    PHASE_RANGE = [-360, 360]
+    # The caches are read on every property access. pymeasure's Channel
+    # still gives instances a __dict__ for parent, id and the rest.
+    __slots__ = ('_queries', '_cache', '_formatters')
+
+    def __init__(self, parent, id, **kwargs):
+        super().__init__(parent, id, **kwargs)
+        # Queries with the channel id already inserted, keyed by the query template
+        self._queries = {}
+        # Property values last read back from the instrument, see CachedControl
+        self._cache = {}
+        # Set commands with the channel id inserted, see FastControl
+        self._formatters = {}
+
+    def clear_cache(self):
+        """Forgets the cached property values, so the next reads query the instrument."""
+        self._cache.clear()
 
-    shape = Instrument.control(
+    def read_property(self, name: str, refresh: bool = False):
+        """
+        Reads a channel property, e.g. 'frequency'.
+
+        :param refresh: Query the instrument even if the value is cached,
+            e.g. to see changes made from the front panel.
+        """
+        if refresh:
+            self._cache.pop(name, None)
+        return getattr(self, name)
+
+    def insert_id(self, command: str) -> str:
+        """
+        Inserts the channel id in a command. Queries are fixed per channel,
+        so each one is only formatted the first time it is sent.
+        """
+        if not command.endswith('?'):
+            return super().insert_id(command)
+        query = self._queries.get(command)
+        if query is None:
+            query = super().insert_id(command)
+            self._queries[command] = query
+        return query
+
+    shape = FastControl(
         "SOURce{ch}:FUNCtion?", "SOURce{ch}:FUNCtion %s",
         """Controls the waveform shape (function) of the channel.""",
         validator=strict_discrete_set,
         values=SHAPES,
-        map_values=True
+        set_process=SHAPES.__getitem__,
+        get_process=_SHAPES_INV.__getitem__
     )
 
-    frequency = Instrument.control(
+    frequency = FastControl(
         "SOURce{ch}:FREQuency?", "SOURce{ch}:FREQuency %e",
         """Controls the frequency of the waveform in Hz.""",
-        validator=strict_range,
-        values=[1e-6, 25e6]
+        validator=_cached_strict_range,
+        values=FREQUENCY_RANGE
     )
 
-    amplitude = Instrument.control(
+    amplitude = FastControl(
         "SOURce{ch}:AMPlitude?", "SOURce{ch}:AMPlitude %f",
         """Controls the peak-to-peak amplitude in Volts (Vpp).""",
-        validator=strict_range,
-        values=[0.001, 10.0]
+        validator=_cached_strict_range,
+        values=AMPLITUDE_RANGE
     )
 
-    offset = Instrument.control(
+    offset = FastControl(
         "SOURce{ch}:DCOffset?", "SOURce{ch}:DCOffset %f",
         """Controls the DC offset in Volts."""
     )
 
-    phase = Instrument.control(
+    phase = FastControl(
         "SOURce{ch}:PHASe?", "SOURce{ch}:PHASe %f",
         """Controls the phase shift in degrees.""",
-        validator=strict_range,
-        values=[-360, 360]
+        validator=_cached_strict_range,
+        values=PHASE_RANGE
     )
 
-    output_enabled = Instrument.control(
+    output_enabled = FastControl(
         "OUTPut{ch}?", "OUTPut{ch} %s",
         """Controls whether the channel output is ON (True) or OFF (False).""",
         validator=strict_discrete_set,
@@ -64,30 +208,64 @@ class AFG2225Channel(Channel):
         set_process=lambda v: 'ON' if bool(v) else 'OFF'
     )
 
-    load = Instrument.control(
+    load = FastControl(
         "OUTPut{ch}:LOAD?", "OUTPut{ch}:LOAD %s",
         """Controls the output load impedance ('50ohm' or 'highZ').""",
         validator=strict_discrete_set,
         values=LOADS,
-        map_values=True
+        set_process=LOADS.__getitem__,
+        get_process=_LOADS_INV.__getitem__
     )
 
-    duty_cycle = Instrument.control(
+    duty_cycle = FastControl(
         "SOURce{ch}:SQUare:DCYCle?", "SOURce{ch}:SQUare:DCYCle %f",
         """Controls the duty cycle for Square waveforms in percent (1 to 99).""",
-        validator=strict_range,
+        validator=_cached_strict_range,
         values=[1.0, 99.0]
     )
 
-    ramp_symmetry = Instrument.control(
+    ramp_symmetry = FastControl(
         "SOURce{ch}:RAMP:SYMMetry?", "SOURce{ch}:RAMP:SYMMetry %f",
         """Controls the symmetry for Ramp waveforms in percent (0 to 100).""",
-        validator=strict_range,
+        validator=_cached_strict_range,
         values=[0, 100]
     )
 
+    def configure(self, shape=None, frequency=None, amplitude=None, offset=None, phase=None, output=None):
+        """
+        Sets several channel settings with a single compound SCPI message.
+        Settings left as None are not changed. Values are validated like
+        the corresponding properties before anything is sent.
+
+        :param shape: Waveform shape, one of SHAPES.
+        :param frequency: Frequency in Hz.
+        :param amplitude: Peak-to-peak amplitude in Vpp.
+        :param offset: DC offset in Volts.
+        :param phase: Phase shift in degrees.
+        :param output: True to turn the output ON, False for OFF.
+        """
+        commands = []
+        if shape is not None:
+            shape = strict_discrete_set(shape, self.SHAPES)
+            commands.append(f'SOURce{{ch}}:FUNCtion {self.SHAPES[shape]}')
+        if frequency is not None:
+            frequency = _cached_strict_range(frequency, self.FREQUENCY_RANGE)
+            commands.append(f'SOURce{{ch}}:FREQuency {frequency:e}')
+        if amplitude is not None:
+            amplitude = _cached_strict_range(amplitude, self.AMPLITUDE_RANGE)
+            commands.append(f'SOURce{{ch}}:AMPlitude {amplitude:f}')
+        if offset is not None:
+            commands.append(f'SOURce{{ch}}:DCOffset {offset:f}')
+        if phase is not None:
+            phase = _cached_strict_range(phase, self.PHASE_RANGE)
+            commands.append(f'SOURce{{ch}}:PHASe {phase:f}')
+        if output is not None:
+            commands.append(f'OUTPut{{ch}} {"ON" if output else "OFF"}')
+        if commands:
+            self.write(_compound(commands))
+
 
-class AFG2225(SCPIMixin, Instrument):
+class AFG2225(TerminationMixin, SCPIMixin, Instrument):
     """
     Represents the GW Instek AFG-2225 Arbitrary Function Generator
     and provides a high-level interface for interacting with the instrument.
@@ -96,23 +274,37 @@ class AFG2225(SCPIMixin, Instrument):
     ch1 = Instrument.ChannelCreator(AFG2225Channel, 1)
     ch2 = Instrument.ChannelCreator(AFG2225Channel, 2)
 
-    def __init__(self, adapter, name="GW Instek AFG-2225", **kwargs):
+    # VISA read chunk size, so a reply is read with a single low-level read
+    CHUNK_SIZE = 1 << 20
+    # First *STB? poll delay in seconds of wait_for_opc, doubled on every poll
+    OPC_FIRST_POLL = 0.02
+
+    def __init__(self, adapter, name="GW Instek AFG-2225", command_pacing=0, low_latency=True,
+                 cache_reads=True, **kwargs):
         """
         Initializes the function generator.
         :param adapter: VISA resource string for the instrument.
+        :param command_pacing: Delay in seconds before every command, for links
+            that drop commands sent back to back. Disabled by default.
+        :param low_latency: Put a serial port in low latency mode, see enable_low_latency().
+        :param cache_reads: Reuse channel property values read back since the last
+            write, see CachedControl. Disable it when the front panel is used too.
         :param kwargs: Keyword arguments for the Instrument base class.
         """
+        self.command_pacing = command_pacing
+        self.cache_reads = cache_reads
+        kwargs.setdefault('chunk_size', self.CHUNK_SIZE)
         super().__init__(
             adapter,
             name,
-            read_termination='\n',
-            write_termination='\n',
             **kwargs
         )
-        
+        disable_nagle(self.adapter)
+        if low_latency:
+            enable_low_latency(self.adapter)
+
     def setup(self):
         self.reset()
-        time.sleep(2)
         self.clear()
         # Enable the Operation Complete bit (1) to be summarized in the Status Byte
         self.write('*ESE 1')
@@ -121,11 +313,36 @@ class AFG2225(SCPIMixin, Instrument):
 
     def reset(self):
         """Resets the instrument to its factory default state."""
-        self.write("*RST")
+        self.write_sync("*RST")
         
     def write(self, command, **kwargs):
-        time.sleep(0.5)  # Allow time for the instrument to process commands
+        if ';' in command or not command.rstrip().endswith('?'):
+            # May change the channel settings
+            self.clear_cache()
+        if self.command_pacing:
+            time.sleep(self.command_pacing)
         return super().write(command, **kwargs)
+
+    def clear_cache(self):
+        """Forgets the cached property values of both channels, see CachedControl."""
+        for channel in getattr(self, 'channels', {}).values():
+            channel.clear_cache()
+
+    def write_many(self, commands):
+        """
+        Writes several SCPI commands, given with their full paths,
+        as a single compound message.
+        """
+        self.write(_compound(commands))
+
+    def write_sync(self, command, **kwargs):
+        """
+        Writes a command and blocks until the instrument has completed it,
+        using the *OPC? handshake. Use it for commands whose completion matters
+        before the next one is sent, such as *RST.
+        """
+        self.write(command, **kwargs)
+        self.ask('*OPC?')
         
     def wait_for_opc(self, timeout=5, poll_interval=0.5):
         """
@@ -133,12 +350,19 @@ class AFG2225(SCPIMixin, Instrument):
         This is done by sending the *OPC command and then polling the
         Status Byte Register until the Event Summary Bit (ESB) is set.
 
+        When the VISA session supports service request events, the wait
+        blocks on the SRQ enabled by setup() instead of polling.
+
         :param timeout: Maximum time to wait in seconds.
-        :param poll_interval: Time to wait between polls in seconds.
+        :param poll_interval: Longest time to wait between polls in seconds.
         """
+        if self._wait_for_srq(timeout):
+            return
         self.write('*OPC')
-        time.sleep(0.1)
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        # Poll soon after *OPC and back off towards poll_interval, so short
+        # operations return without waiting out a whole interval
+        delay = min(self.OPC_FIRST_POLL, poll_interval)
         while True:
             try:
                 status_byte = int(self.ask('*STB?'))
@@ -148,10 +372,40 @@ class AFG2225(SCPIMixin, Instrument):
             except Exception as e:
                 log.error(f"Error polling status byte: {e}")
             
-            if (time.time() - start_time) > timeout:
+            now = time.monotonic()
+            if now > deadline:
                 raise TimeoutError("Timeout waiting for operation to complete.")
             
-            time.sleep(poll_interval)
+            time.sleep(min(delay, deadline - now))
+            delay = min(delay * 2, poll_interval)
+
+    def _wait_for_srq(self, timeout):
+        """
+        Sends *OPC and waits for the resulting service request event.
+
+        :return: False if the session does not support SRQ events,
+            in which case nothing is sent.
+        """
+        connection = getattr(self.adapter, 'connection', None)
+        if connection is None:
+            return False
+        try:
+            connection.enable_event(EventType.service_request, EventMechanism.queue)
+        except (VisaIOError, NotImplementedError):
+            return False
+        try:
+            self.write('*OPC')
+            response = connection.wait_on_event(
+                EventType.service_request, int(timeout * 1000), capture_timeout=True
+            )
+            if response.timed_out:
+                raise TimeoutError("Timeout waiting for operation to complete.")
+        finally:
+            connection.disable_event(EventType.service_request, EventMechanism.queue)
+        # Reading the status byte clears the SRQ, *CLS resets the event register
+        connection.read_stb()
+        self.clear()
+        return True
 
     def sync_phase(self):
         """
@@ -161,6 +415,20 @@ class AFG2225(SCPIMixin, Instrument):
         self.write("SOURce1:PHASe:SYNChronize")
         log.info("Phase of Channel 1 and 2 synchronized.")
 
+    def sync_and_read_phases(self) -> tuple[float, float]:
+        """
+        Synchronizes the phase of both channels and reads back their phases,
+        in a single compound SCPI transaction.
+
+        :return: The phases of channel 1 and 2 in degrees.
+        """
+        reply = self.ask(_compound(('SOURce1:PHASe:SYNChronize', 'SOURce1:PHASe?', 'SOURce2:PHASe?')))
+        phase1, phase2 = (float(value) for value in reply.split(';'))
+        self.ch1._cache['phase'] = phase1
+        self.ch2._cache['phase'] = phase2
+        log.info("Phase of Channel 1 and 2 synchronized.")
+        return phase1, phase2
+
     def remote_mode(self):
         """Sets the instrument to remote mode, locking the front panel."""
         self.write("SYSTem:REMote")
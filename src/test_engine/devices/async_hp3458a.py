@@ -0,0 +1,169 @@
+import asyncio
+import weakref
+
+from pyvisa.constants import InterfaceType
+
+from devices.hp3458a import HP3458A
+
+
+# One lock per GPIB board, keyed by the interface part of the resource string,
+# and one per meter on other transports. An asyncio.Lock belongs to one event loop,
+# so the locks are kept per running loop: event loop -> {lock key: lock}
+_BUS_LOCKS = weakref.WeakKeyDictionary()
+
+
+def _bus_lock(device: HP3458A) -> asyncio.Lock:
+    """
+    Returns the lock serializing the meters on the GPIB board of `device`,
+    or the lock of `device` alone if it is not on a GPIB bus,
+    for the running event loop.
+    """
+    connection = getattr(device.adapter, 'connection', None)
+    if connection is not None and connection.interface_type == InterfaceType.gpib:
+        key = ('bus', connection.resource_name.split('::')[0])
+    else:
+        key = ('device', id(device))
+    locks = _BUS_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(key, asyncio.Lock())
+
+
+async def read_all(*meters) -> list:
+    """
+    Triggers every meter first, then collects their readings concurrently,
+    so reading N meters takes about as long as the slowest one:
+    | readings = await read_all(meter1, meter2, meter3)
+
+    The meters can be HP3458A or AsyncHP3458A instances. Triggers and readings
+    run in worker threads under the same bus locks as AsyncHP3458A, so meters
+    on the same GPIB board are read out one after the other,
+    but they are still taken at the same time.
+    """
+    devices = [getattr(meter, 'device', meter) for meter in meters]
+
+    async def run(device, func):
+        async with _bus_lock(device):
+            return await asyncio.to_thread(func)
+
+    await asyncio.gather(*(run(device, device.trigger) for device in devices))
+    return await asyncio.gather(*(run(device, device.wait_reading) for device in devices))
+
+
+class AsyncHP3458A:
+    """
+    Awaitable wrapper around an HP3458A, for configuring and reading several
+    meters concurrently from one event loop:
+    | meters = [AsyncHP3458A(resource) for resource in resources]
+    | await asyncio.gather(*(meter.conf_function_DCV(10, 1) for meter in meters))
+    | readings = await asyncio.gather(*(meter.get_reading() for meter in meters))
+
+    The blocking driver calls run in worker threads. Meters on the same GPIB
+    board are serialized, meters on other boards or transports run concurrently.
+    """
+
+    def __init__(self, adapter, pipelined=False, **kwargs):
+        """
+        Initialize the meter. Other arguments are the same as for HP3458A.
+
+        :param pipelined: Configuration calls return as soon as their commands are
+            queued, while the meter is still taking them, see HP3458A.start_async().
+            The next reading waits for them. Call flush() to wait explicitly.
+        """
+        self.device = HP3458A(adapter, **kwargs)
+        if pipelined:
+            self.device.start_async()
+
+    async def _call(self, func, *args, **kwargs):
+        async with _bus_lock(self.device):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _get(self, name):
+        async with _bus_lock(self.device):
+            return await asyncio.to_thread(getattr, self.device, name)
+
+    # System-level commands and properties
+    async def id(self) -> str:
+        """Reads the instrument identification."""
+        return await self._get('id')
+
+    async def temperature(self) -> float:
+        """Reads the internal temperature of the multimeter in Celsius."""
+        return await self._get('temperature')
+
+    async def error(self) -> str:
+        """See HP3458A.error."""
+        return await self._call(self.device.error)
+
+    async def setup(self, use_binary: bool = False):
+        """See HP3458A.setup."""
+        await self._call(self.device.setup, use_binary)
+
+    async def reset(self):
+        """See HP3458A.reset."""
+        await self._call(self.device.reset)
+
+    async def beep(self):
+        """See HP3458A.beep."""
+        await self._call(self.device.beep)
+
+    async def display(self, message: str):
+        """See HP3458A.display."""
+        await self._call(self.device.display, message)
+
+    async def get_reading(self, trig=True):
+        """See HP3458A.get_reading."""
+        return await self._call(self.device.get_reading, trig)
+
+    # --- Measurement Configuration Functions ---
+
+    async def reading_configuration(self, *args, **kwargs):
+        """See HP3458A.reading_configuration."""
+        await self._call(self.device.reading_configuration, *args, **kwargs)
+
+    async def conf_function_DCV(self, *args, **kwargs):
+        """See HP3458A.conf_function_DCV."""
+        await self._call(self.device.conf_function_DCV, *args, **kwargs)
+
+    async def conf_function_DCI(self, *args, **kwargs):
+        """See HP3458A.conf_function_DCI."""
+        await self._call(self.device.conf_function_DCI, *args, **kwargs)
+
+    async def conf_function_ACV(self, *args, **kwargs):
+        """See HP3458A.conf_function_ACV."""
+        await self._call(self.device.conf_function_ACV, *args, **kwargs)
+
+    async def conf_function_ACI(self, *args, **kwargs):
+        """See HP3458A.conf_function_ACI."""
+        await self._call(self.device.conf_function_ACI, *args, **kwargs)
+
+    async def conf_function_OHM2W(self, *args, **kwargs):
+        """See HP3458A.conf_function_OHM2W."""
+        await self._call(self.device.conf_function_OHM2W, *args, **kwargs)
+
+    async def conf_function_OHM4W(self, *args, **kwargs):
+        """See HP3458A.conf_function_OHM4W."""
+        await self._call(self.device.conf_function_OHM4W, *args, **kwargs)
+
+    async def conf_function_FREQ(self, *args, **kwargs):
+        """See HP3458A.conf_function_FREQ."""
+        await self._call(self.device.conf_function_FREQ, *args, **kwargs)
+
+    async def conf_function_ACDCV(self, *args, **kwargs):
+        """See HP3458A.conf_function_ACDCV."""
+        await self._call(self.device.conf_function_ACDCV, *args, **kwargs)
+
+    async def conf_function_digitize(self, *args, **kwargs):
+        """See HP3458A.conf_function_digitize."""
+        await self._call(self.device.conf_function_digitize, *args, **kwargs)
+
+    async def flush(self):
+        """See HP3458A.flush."""
+        await self._call(self.device.flush)
+
+    async def close(self):
+        """
+        Close the connection to the instrument, after the queued commands are written.
+        """
+        try:
+            await self._call(self.device.stop_async)
+        finally:
+            await self._call(self.device.adapter.close)
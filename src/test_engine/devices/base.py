@@ -0,0 +1,73 @@
+import logging
+from types import MappingProxyType
+
+from pyvisa.constants import InterfaceType, VI_ATTR_TCPIP_NODELAY
+from pyvisa.errors import VisaIOError
+
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Terminations used by all drivers unless the caller passes its own.
+# Shared and read-only, so no per-instance dict is built.
+_TERMINATION_DEFAULTS = MappingProxyType({
+    'read_termination': '\n',
+    'write_termination': '\n',
+})
+
+
+class TerminationMixin:
+    """
+    Mixin for pymeasure instruments that use '\\n' for both read and write
+    termination. Must come before the pymeasure base classes, e.g.
+    | class HP53131A(TerminationMixin, SCPIMixin, Instrument)
+
+    Terminations given by the caller take precedence over the defaults.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **{**_TERMINATION_DEFAULTS, **kwargs})
+
+
+def disable_nagle(adapter) -> bool:
+    """
+    Disables Nagle's algorithm on the TCPIP session behind a pymeasure VISA adapter
+    (LXI instruments, LAN-GPIB gateways), so short commands are sent at once instead
+    of waiting for the previous segment to be acknowledged.
+    Serial, USB and GPIB sessions, or sessions not supporting it, are left unchanged.
+
+    :return: True if Nagle's algorithm was disabled.
+    """
+    connection = getattr(adapter, 'connection', None)
+    if connection is None or connection.interface_type != InterfaceType.tcpip:
+        return False
+    try:
+        connection.set_visa_attribute(VI_ATTR_TCPIP_NODELAY, True)
+    except (VisaIOError, NotImplementedError):
+        log.debug("TCP_NODELAY is not supported by this session")
+        return False
+    return True
+
+
+def enable_low_latency(adapter) -> bool:
+    """
+    Puts the serial port behind a pymeasure VISA adapter in low latency mode,
+    so the USB-serial driver passes received bytes on at once instead of after
+    its latency timer (16 ms by default on FTDI chips), which delays every query.
+
+    Only serial sessions opened with the pyvisa-py backend on Linux are supported,
+    for anything else nothing is changed.
+
+    :return: True if low latency mode was enabled.
+    """
+    connection = getattr(adapter, 'connection', None)
+    if connection is None or connection.interface_type != InterfaceType.asrl:
+        return False
+    try:
+        # pyserial port of the pyvisa-py session
+        port = connection.visalib.sessions[connection.session].interface
+        port.set_low_latency_mode(True)
+    except (AttributeError, KeyError, OSError, ValueError) as e:
+        log.debug(f"Serial low latency mode not enabled: {e}")
+        return False
+    return True
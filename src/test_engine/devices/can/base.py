@@ -8,6 +8,8 @@ from adapters.can import CANAdapter
 
 
 class CANBase:
+    __slots__ = ('adapter', 'node')
+
     NODE_ID = None
 
     def __init__(self):
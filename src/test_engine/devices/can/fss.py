@@ -2,6 +2,8 @@ from devices.can.base import CANBase
 
 
 class FSS(CANBase):
+    __slots__ = ()
+
     NODE_ID = 29
 
     def __init__(self):
@@ -3,6 +3,8 @@ from devices.can.base import CANBase
 
 
 class TCU(CANBase):
+    __slots__ = ()
+
     NODE_ID = None
 
     def __init__(self):
@@ -1,30 +1,181 @@
+import contextlib
+import functools
+import queue
+import threading
+import time
+
+import numpy as np
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set
 from pymeasure.instruments.hp import HPLegacyInstrument
+from pyvisa.constants import StatusCode
+from pyvisa.errors import VisaIOError
+
+from devices.base import TerminationMixin, disable_nagle, enable_low_latency
+
+
+# Commands for the usual ranges (1e-7 to 1e9, every function) and integration times,
+# built once so sweeps do not format them again on every configuration.
+# Ranges use 6 significant digits, fixed decimals would turn 1e-7 into 0.
+_RANGE_COMMANDS = {value: f'RANGE {value:.6g}' for value in (float(f'1e{e}') for e in range(-7, 10))}
+_NPLC_COMMANDS = {value: f'NPLC {value:f}' for value in (0.02, 0.1, 0.2, 1, 2, 10, 20, 50, 100, 1000)}
+
+
+# ON/OFF commands of the flag settings, keyed by the flag
+_AZERO = {True: 'AZERO ON', False: 'AZERO OFF'}
+_FIXEDZ = {True: 'FIXEDZ ON', False: 'FIXEDZ OFF'}
+_OCOMP = {True: 'OCOMP ON', False: 'OCOMP OFF'}
+_TBUFF = {True: 'TBUFF ON', False: 'TBUFF OFF'}
+
+# FREQ resolution for each valid gate time in seconds, see conf_function_FREQ()
+_GATE_TIME_RESOLUTIONS = {
+    1.0:    0.00001,  # 7 digits
+    0.1:    0.0001,   # 7 digits
+    0.01:   0.001,    # 6 digits
+    0.001:  0.01,     # 5 digits
+    0.0001: 0.1       # 4 digits
+}
+_INVALID_GATE_TIME = f"Invalid gate_time. Must be one of {list(_GATE_TIME_RESOLUTIONS)}"
+
+# Commands of setup(), with and without binary readings
+_SETUP = ('END ALWAYS', 'TRIG HOLD')
+_SETUP_BINARY = (*_SETUP, 'OFORMAT SREAL', 'MFORMAT SREAL', 'MEM FIFO')
+
+# Normal preset, restoring the binary formats when they were requested by setup()
+_PRESET_NORM = ('PRESET NORM',)
+_PRESET_NORM_BINARY = ('PRESET NORM', 'OFORMAT SREAL', 'MFORMAT SREAL')
+
+
+def _range_command(mrange) -> str:
+    command = _RANGE_COMMANDS.get(mrange)
+    return f'RANGE {mrange:.6g}' if command is None else command
+
+
+@functools.lru_cache(maxsize=64)
+def _configuration_commands(function: tuple[str, ...], mrange, nplc, AutoZero, HiZ, OffsetCompensation,
+                            binary_output) -> tuple[str, ...]:
+    """
+    Returns the commands of a measurement configuration: the normal preset,
+    the function commands and the common settings. Cached per parameter set,
+    so repeating a configuration in a sweep costs a single lookup.
+    """
+    nplc_command = _NPLC_COMMANDS.get(nplc)
+    return (
+        *(_PRESET_NORM_BINARY if binary_output else _PRESET_NORM),
+        *function,
+        'NDIG 6',
+        'RANGE AUTO' if mrange is None else _range_command(mrange),
+        f'NPLC {nplc:f}' if nplc_command is None else nplc_command,
+        _AZERO[bool(AutoZero)],
+        _FIXEDZ[bool(HiZ)],
+        _OCOMP[bool(OffsetCompensation)],
+    )
 
 
-class HP3458A(HPLegacyInstrument):
+@functools.lru_cache(maxsize=64)
+def _reading_burst_commands(count: int, interval: float | None) -> tuple[str, ...]:
+    """
+    Returns the commands taking a burst of `count` readings, paced by the timer
+    if `interval` is given. Cached like _configuration_commands().
+    """
+    if interval:
+        return ('MEM FIFO', f'TIMER {interval:f}', f'NRDGS {count},TIMER')
+    return ('MEM FIFO', f'NRDGS {count},AUTO')
+
+
+class HP3458A(TerminationMixin, HPLegacyInstrument):
     """
     Represents the Hewlett-Packard 3458A 8.5-digit multimeter.
     """
 
-    def __init__(self, adapter, name="Hewlett-Packard 3458A", **kwargs):
+    # NumPy dtypes of the binary output formats
+    BINARY_FORMATS = {'SREAL': '>f4', 'DREAL': '>f8'}
+    _binary_dtypes = {name: np.dtype(code) for name, code in BINARY_FORMATS.items()}
+
+    # VISA read chunk size, large enough for a digitizer record in a few reads
+    CHUNK_SIZE = 1 << 20
+
+    # Longest message shown by display()
+    DISPLAY_LENGTH = 75
+
+    # Time in seconds the temperature property reuses the last reading
+    TEMPERATURE_TTL = 1.0
+
+    TRIGGER_SOURCES = ['SGL', 'EXT', 'HOLD']
+    ARM_SOURCES = ['AUTO', 'SGL', 'EXT', 'HOLD']
+
+    # Setting commands whose last written value is remembered, see _coalesce().
+    # Commands with side effects (TRIG, TARM, MEM...) are never skipped.
+    COALESCED_COMMANDS = frozenset({
+        'RANGE', 'NPLC', 'NDIG', 'AZERO', 'FIXEDZ', 'OCOMP', 'LFILTER', 'TIMER', 'NRDGS',
+        'OFORMAT', 'MFORMAT', 'END', 'ACBAND', 'SETACV', 'FSOURCE', 'DELAY', 'SWEEP', 'TBUFF'
+    })
+    # Commands after which the remembered settings no longer apply
+    STATE_RESET_COMMANDS = frozenset({
+        'RESET', 'PRESET', 'CALL', 'FUNC', 'DCV', 'DCI', 'ACV', 'ACI', 'ACDCV', 'OHM', 'OHMF',
+        'FREQ', 'PER', 'DSDC', 'DSAC', 'SSDC', 'SSAC', 'DIRECT'
+    })
+
+    def __init__(self, adapter, name="Hewlett-Packard 3458A", batch_commands=True, low_latency=True, **kwargs):
+        """
+        :param adapter: VISA resource string for the instrument.
+        :param batch_commands: Send the commands of a configuration as a single
+            message, see write_many(). Disable it for transports that cannot
+            take several commands in one message.
+        :param low_latency: Put a serial port in low latency mode, see enable_low_latency().
+        :param kwargs: Keyword arguments for the Instrument base class.
+
+        TCPIP sessions (LAN-GPIB gateways) get TCP_NODELAY, see disable_nagle().
+        """
+        self.batch_commands = batch_commands
+        # Last command written for each setting in COALESCED_COMMANDS, keyed by its mnemonic
+        self._last_cmd: dict[str, str] = {}
+        # Identification, see id
+        self._id: str | None = None
+        # Last temperature read and its time.monotonic() timestamp, see temperature
+        self._temperature: tuple[float, float] | None = None
+        # Readings per trigger set by the subroutines stored with store_burst_subroutine()
+        self._subroutine_counts: dict[int, int] = {}
+        # Background writer, see start_async()
+        self._writer: threading.Thread | None = None
+        self._out_queue: queue.Queue | None = None
+        self._write_error: Exception | None = None
+        # Commands held back inside batched(), None when not batching
+        self._pending: list[str] | None = None
+        kwargs.setdefault('chunk_size', self.CHUNK_SIZE)
         super().__init__(
             adapter,
             name,
-            read_termination='\n',
-            write_termination='\n',
             **kwargs
         )
+        disable_nagle(self.adapter)
+        if low_latency:
+            enable_low_latency(self.adapter)
+        # Use SREAL output for normal readings, set by setup()
+        self.binary_output = False
+        # Output format currently set on the instrument and readings returned per trigger
+        self._output_format = 'ASCII'
+        self._reading_count = 1
 
     # System-level commands and properties
-    id = Instrument.measurement(
-        "ID?", """Reads the instrument identification"""
-    )
-
-    temperature = Instrument.measurement(
-        "TEMP?", """Reads the internal temperature of the multimeter in Celsius."""
-    )
+    @property
+    def id(self):
+        """Reads the instrument identification. Queried once, then cached until reset()."""
+        if self._id is None:
+            self._id = self.ask('ID?').strip()
+        return self._id
+
+    @property
+    def temperature(self) -> float:
+        """
+        Reads the internal temperature of the multimeter in Celsius.
+        Readings younger than TEMPERATURE_TTL seconds are reused, see get_temperature().
+        """
+        if self._temperature is not None:
+            timestamp, value = self._temperature
+            if time.monotonic() - timestamp < self.TEMPERATURE_TTL:
+                return value
+        return self.get_temperature()
 
     reading_counts = Instrument.measurement(
         "MCOUNT?", """Reads the number of readings currently in memory."""
@@ -64,14 +215,14 @@ class HP3458A(HPLegacyInstrument):
         "TRIG?", "TRIG %s",
         """Sets the trigger event source.""",
         validator=strict_discrete_set,
-        values=['SGL', 'EXT', 'HOLD']
+        values=TRIGGER_SOURCES
     )
 
     arm_source = Instrument.control(
         "TARM?", "TARM %s",
         """Sets the event that arms the trigger.""",
         validator=strict_discrete_set,
-        values=['AUTO', 'SGL', 'EXT', 'HOLD']
+        values=ARM_SOURCES
     )
 
     burst_interval = Instrument.control(
@@ -89,45 +240,470 @@ class HP3458A(HPLegacyInstrument):
         """Sets the integration time in Number of Power Line Cycles (NPLC)."""
     )
 
-    def setup(self):
-        self.write('END ALWAYS')
-        self.write('TRIG HOLD')
+    def setup(self, use_binary: bool = False):
+        """
+        Prepares the meter for remote readings.
+
+        Args:
+            use_binary (bool): Transfer readings as 4-byte SREAL values instead of ASCII.
+                               Faster to transfer and parse, with about 7 significant digits.
+                               Readings are also stored in memory as SREAL, so the reading
+                               memory holds twice as many of them as in the default DREAL.
+        """
+        self.invalidate_cache()
+        self.binary_output = use_binary
+        if use_binary:
+            self._output_format = 'SREAL'
+        self.write_many(_SETUP_BINARY if use_binary else _SETUP)
+
+    def write(self, command, **kwargs):
+        """
+        Writes a command, or several separated by ';'.
+        Settings that would not change are skipped, see _coalesce().
+        """
+        commands = self._coalesce(command.split(';'))
+        if commands:
+            self._write_commands(commands, **kwargs)
+
+    def write_many(self, commands):
+        """
+        Writes several commands as a single message, separated by ';',
+        so a configuration costs one bus transaction instead of one per command.
+        Without batch_commands they are written one by one.
+        Settings that would not change are skipped, see _coalesce().
+        """
+        commands = self._coalesce(commands)
+        if commands:
+            self._write_commands(commands)
+
+    def _write_commands(self, commands, **kwargs):
+        if self._pending is not None:
+            self._pending.extend(commands)
+            return
+        self._send_commands(commands, **kwargs)
+
+    def _send_commands(self, commands, **kwargs):
+        messages = (';'.join(commands),) if self.batch_commands else commands
+        if self._writer is not None:
+            for message in messages:
+                self._out_queue.put(message)
+            return
+        try:
+            for message in messages:
+                super().write(message, **kwargs)
+        except Exception:
+            # What reached the instrument is unknown
+            self.invalidate_cache()
+            raise
+
+    @contextlib.contextmanager
+    def batched(self):
+        """
+        Holds back the commands written in the block, including property settings,
+        and sends them together when the block ends:
+        | with meter.batched():
+        |     meter.nplc = 10
+        |     meter.arm_source = 'AUTO'
+
+        Reading inside the block, or calling flush(), sends the commands held so far.
+        Without batch_commands they are still written one by one.
+        If the block raises, the commands held back are dropped.
+        """
+        if self._pending is not None:
+            # Already batching
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        except BaseException:
+            self._pending = None
+            # The remembered settings include the dropped commands
+            self.invalidate_cache()
+            raise
+        commands, self._pending = self._pending, None
+        if commands:
+            self._send_commands(self._collapse(commands))
+
+    def read(self, **kwargs):
+        self.flush()
+        return super().read(**kwargs)
+
+    def read_bytes(self, count, **kwargs):
+        self.flush()
+        return super().read_bytes(count, **kwargs)
+
+    def ask(self, command, query_delay=None, timeout=None):
+        """
+        Writes a command and reads the response.
+
+        :param query_delay: Delay between writing and reading in seconds.
+        :param timeout: Read timeout in seconds for this query only. Defaults to the
+            adapter timeout. A fast query can then fail fast without lowering the
+            timeout of slow ones.
+        :raises TimeoutError: If the response does not arrive within `timeout`.
+            The connection is left open.
+        """
+        if timeout is None:
+            return super().ask(command, query_delay)
+        with self._read_timeout(timeout):
+            return super().ask(command, query_delay)
+
+    @contextlib.contextmanager
+    def _read_timeout(self, timeout):
+        """Sets the VISA timeout of the connection for the duration of the block."""
+        connection = getattr(self.adapter, 'connection', None)
+        if connection is None:
+            yield
+            return
+        previous = connection.timeout
+        connection.timeout = timeout * 1000
+        try:
+            yield
+        except VisaIOError as e:
+            if e.error_code != StatusCode.error_timeout:
+                raise
+            raise TimeoutError(f"No response within {timeout} s") from e
+        finally:
+            connection.timeout = previous
+
+    def start_async(self):
+        """
+        Hands the commands written from now on to a background thread instead of
+        waiting for each write to complete, so configuration calls return at once
+        while the instrument catches up.
+
+        Reads first wait for the queued commands, so queries stay in order.
+        With batch_commands, commands queued while a write is in progress are joined
+        into the next write, e.g. a configuration and the trigger following it.
+        Call flush() to wait explicitly and stop_async() to return to blocking writes.
+        A failed background write is raised by the next flush or read.
+        """
+        if self._writer is not None:
+            return
+        self._out_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._drain_writes, name=f'{self.name} writer', daemon=True)
+        self._writer.start()
+
+    def stop_async(self):
+        """
+        Waits for the queued commands and stops the background writer, see start_async().
+        """
+        if self._writer is None:
+            return
+        self._out_queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._out_queue = None
+        self._raise_write_error()
+
+    def flush(self):
+        """
+        Sends the commands held back by batched() and blocks until the commands
+        queued by the background writer are written.
+        """
+        if self._pending:
+            commands, self._pending = self._pending, []
+            self._send_commands(self._collapse(commands))
+        if self._writer is not None:
+            self._out_queue.join()
+        self._raise_write_error()
+
+    def _raise_write_error(self):
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _drain_writes(self):
+        while True:
+            messages = [self._out_queue.get()]
+            # With batch_commands, whatever queued up meanwhile (e.g. a configuration
+            # followed by a trigger) leaves in the same bus transaction
+            while self.batch_commands and messages[-1] is not None:
+                try:
+                    messages.append(self._out_queue.get_nowait())
+                except queue.Empty:
+                    break
+            count = len(messages)
+            stop = messages[-1] is None
+            if stop:
+                messages.pop()
+            try:
+                if messages:
+                    if self.batch_commands:
+                        messages = (';'.join(messages),)
+                    for message in messages:
+                        super().write(message)
+            except Exception as e:
+                # What reached the instrument is unknown
+                self.invalidate_cache()
+                self._write_error = e
+            finally:
+                for _ in range(count):
+                    self._out_queue.task_done()
+            if stop:
+                return
+
+    def _coalesce(self, commands):
+        """
+        Returns the commands that need to be sent, updating the remembered settings.
+
+        A setting in COALESCED_COMMANDS is dropped if it repeats the last value written.
+        If the same setting appears again before the next non-setting command,
+        only the last one is kept.
+        """
+        result = []
+        # Settings queued since the last non-setting command:
+        # mnemonic -> (index in result, value remembered before it)
+        pending = {}
+        for command in commands:
+            command = command.strip()
+            if not command:
+                continue
+            head = command.split(' ', 1)[0].upper()
+            if head not in self.COALESCED_COMMANDS:
+                result.append(command)
+                pending.clear()
+                if head in self.STATE_RESET_COMMANDS:
+                    self._last_cmd.clear()
+                continue
+            if head in pending:
+                # Superseded by this command
+                index, previous = pending.pop(head)
+                result[index] = None
+                if previous is None:
+                    self._last_cmd.pop(head, None)
+                else:
+                    self._last_cmd[head] = previous
+            previous = self._last_cmd.get(head)
+            if previous == command:
+                continue
+            pending[head] = (len(result), previous)
+            result.append(command)
+            self._last_cmd[head] = command
+        return [command for command in result if command is not None]
+
+    def _collapse(self, commands):
+        """
+        Drops the commands held back by batched() that a later one overrides
+        before anything uses them, e.g. a whole configuration followed by another one.
+
+        A setting in COALESCED_COMMANDS is dropped if the same setting follows.
+        Settings, function commands and an earlier PRESET are dropped if a PRESET follows.
+        Other commands (TRIG, MEM, RESET, CALL...) are always kept, and the commands
+        before them are not dropped. Subroutine bodies (SUB ... SUBEND) are kept as is.
+        """
+        result = []
+        # Settings written later, since the last kept command of another kind
+        seen = set()
+        # A PRESET follows, since the last kept command of another kind
+        preset = False
+        in_subroutine = False
+        for command in reversed(commands):
+            head = command.split(' ', 1)[0].upper()
+            if in_subroutine or head == 'SUBEND':
+                # Walking backwards, SUBEND opens the body and SUB closes it
+                in_subroutine = head != 'SUB'
+                seen.clear()
+                preset = False
+            elif head in self.COALESCED_COMMANDS:
+                if preset or head in seen:
+                    continue
+                seen.add(head)
+            elif head == 'PRESET':
+                if preset:
+                    continue
+                preset = True
+            elif head in self.STATE_RESET_COMMANDS and head not in ('RESET', 'CALL'):
+                # Function command
+                if preset:
+                    continue
+                seen.clear()
+            else:
+                seen.clear()
+                preset = False
+            result.append(command)
+        result.reverse()
+        return result
+
+    def invalidate_cache(self):
+        """
+        Forgets the remembered settings, so the next writes are all sent,
+        and the cached temperature.
+        Call it after the instrument state changed outside of this driver, e.g. from the front panel.
+        """
+        self._last_cmd.clear()
+        self._temperature = None
 
     def reset(self):
+        self.invalidate_cache()
+        self._id = None
         self.write('RESET')
+        self._output_format = 'ASCII'
+        self._reading_count = 1
         
     def beep(self):
         self.write('BEEP')
         
     def external_buffer(self, enabled: bool):
-        command = 'TBUFF ON' if enabled else 'TBUFF OFF'
-        self.write(command)
+        self.write(_TBUFF[bool(enabled)])
         
-    def error(self):
+    def error(self, timeout=None):
         """
         Reads the error string from the instrument.
         Example response: 0,"NO ERROR" or 102,"TRIGGER TOO FAST"
+
+        :param timeout: Read timeout in seconds, see ask().
+        """
+        return self.ask('ERRSTR?', timeout=timeout)
+
+    def get_temperature(self, timeout=None) -> float:
+        """
+        Reads the internal temperature in Celsius, always querying the meter.
+        The reading is reused by the temperature property.
+
+        :param timeout: Read timeout in seconds, see ask().
+        """
+        value = float(self.ask('TEMP?', timeout=timeout))
+        self._temperature = (time.monotonic(), value)
+        return value
+
+    def get_reading_count(self, timeout=None) -> int:
         """
-        return self.ask('ERRSTR?')
+        Reads the number of readings in memory, like the reading_counts property.
+
+        :param timeout: Read timeout in seconds, see ask().
+        """
+        return int(float(self.ask('MCOUNT?', timeout=timeout)))
         
     def display(self, message: str):
-        if len(message) > 75:
-            raise ValueError("Display message cannot exceed 75 characters.")
-        self.write(f'DISP MSG,"{message}"')
+        if len(message) > self.DISPLAY_LENGTH:
+            raise ValueError(f"Display message cannot exceed {self.DISPLAY_LENGTH} characters.")
+        # Sent as is: write() would split a message containing ';' into two commands
+        self._write_commands((f'DISP MSG,"{message}"',))
 
     def get_reading(self, trig=True):
-        """Triggers a single reading and returns the value."""
+        """
+        Triggers a single reading and returns the value.
+        Multiple readings are returned as a NumPy array.
+        """
+        if trig:
+            self.trigger()
+        return self.wait_reading()
+
+    def trigger(self):
+        """
+        Triggers a reading without waiting for it, see wait_reading().
+        The reading is read back without a query in between, so a reading costs
+        one write and one read.
+        """
+        self._write_commands(('TRIG SGL',))
+
+    def wait_reading(self):
+        """
+        Waits for the reading of a previous trigger() and returns it, like get_reading().
+        """
+        if self._output_format != 'ASCII':
+            values = self._read_binary(self._reading_count)
+            return values if values.size > 1 else float(values[0])
+        response = self.read()
+        if self._reading_count == 1:
+            # A single reading, the usual case: no array needed
+            try:
+                return float(response)
+            except ValueError:
+                # More readings than configured, e.g. NRDGS written directly
+                pass
+        # Parsed in C into one float64 array rather than one Python float per value
+        values = np.fromstring(response, dtype=np.float64, sep=' ')
+        return values if values.size > 1 else float(values[0])
+
+    def _read_binary(self, count):
+        """
+        Reads `count` readings in the current binary output format,
+        decoded in a single pass into native float64 values.
+        """
+        dtype = self._binary_dtypes[self._output_format]
+        data = self.read_bytes(count * dtype.itemsize)
+        return np.frombuffer(data, dtype=dtype).astype(np.float64)
+
+    def wait_for_readings(self, expected: int, poll=1e-3, max_backoff=25e-3, timeout=10.0) -> int:
+        """
+        Waits until at least `expected` readings are stored in memory.
+
+        MCOUNT? is queried again at once while the count keeps rising. The meter is
+        only given time when it made no progress since the previous poll, starting
+        with `poll` seconds and doubling up to `max_backoff`.
+
+        :return: The number of readings in memory.
+        :raises TimeoutError: If the readings are not stored within `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = poll
+        last_count = -1
+        while True:
+            count = self.get_reading_count()
+            if count >= expected:
+                return count
+            if count > last_count:
+                last_count = count
+                delay = poll
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Only {count} of {expected} readings stored in memory.")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_backoff)
+
+    def read_burst(self, count=None, trig=True, timeout=10.0):
+        """
+        Triggers a burst configured by reading_configuration(), waits for its readings
+        to be stored in memory and reads them out with RMEM.
+
+        With a binary output format the readings come in a single transfer.
+        In ASCII every reading ends with EOI (END ALWAYS), so each one takes a read.
+
+        :param count: Number of readings to read, defaults to the configured burst size.
+        :param timeout: Time in seconds for the readings to be stored, see wait_for_readings().
+        :return: A NumPy array of the readings.
+        """
+        count = self._reading_count if count is None else count
         if trig:
-            self.write('TRIG SGL')
-        response = list(map(float, self.read().strip().split()))
-        return response if len(response) > 1 else response[0]
+            self.trigger()
+        self.wait_for_readings(count, timeout=timeout)
+        self.write(f'RMEM 1,{count}')
+        if self._output_format != 'ASCII':
+            return self._read_binary(count)
+        # END ALWAYS (set by setup()) ends every reading with EOI, so each is read
+        # on its own, then all of them are parsed in a single pass
+        return np.fromstring(' '.join([self.read() for _ in range(count)]), dtype=np.float64, sep=' ')
+
+    def acquire_burst(self, count: int, interval=None, timeout=10.0):
+        """
+        Takes `count` readings paced by the meter itself and returns them,
+        instead of calling get_reading() in a loop with a round-trip per reading:
+        | readings = meter.acquire_burst(1000, interval=1e-3)
+
+        The burst setup and the trigger are sent as one message, then the readings
+        are read out of memory, see read_burst(). Call setup(use_binary=True) first
+        to read them in a single binary transfer instead of one read per reading.
+
+        :param interval: Time between readings in seconds, see reading_configuration().
+            Defaults to None, taking the readings as fast as the configuration allows.
+        :param timeout: Time in seconds for the readings to be stored.
+        :return: A NumPy array of the readings.
+        """
+        with self.batched():
+            self.reading_configuration(count, interval)
+            self.trigger()
+        return self.read_burst(count, trig=False, timeout=timeout)
     
     # --- Helper & Configuration Functions ---
     # TODO: Implement interrupt before reading.
 
-    def __set_triggering(self, source, arm_source):
+    def __triggering_commands(self, source, arm_source):
         """
-        Sets the trigger and trigger arming source.
+        Returns the commands setting the trigger and trigger arming source.
 
         Args:
             source (str): The trigger event source. Common values:
@@ -138,12 +714,13 @@ class HP3458A(HPLegacyInstrument):
         
         SCPI Commands: TARM, TRIG
         """
-        self.arm_source = arm_source
-        self.trigger_source = source
+        arm_source = strict_discrete_set(arm_source, self.ARM_SOURCES)
+        source = strict_discrete_set(source, self.TRIGGER_SOURCES)
+        return (f'TARM {arm_source}', f'TRIG {source}')
 
-    def __set_reading_burst(self, count: int, interval: float | None):
+    def __reading_burst_commands(self, count: int, interval: float | None):
         """
-        Configures the instrument to take a burst of readings.
+        Returns the commands configuring the instrument to take a burst of readings.
 
         Args:
             count (int): The number of readings to take per trigger.
@@ -153,70 +730,92 @@ class HP3458A(HPLegacyInstrument):
         
         SCPI Commands: NRDGS, TIMER
         """
-        self.write('MEM FIFO')
-        if interval:
-            self.burst_interval = interval
-            self.write(f'NRDGS {count},TIMER')
-        else:
-            self.write(f'NRDGS {count},AUTO')
-
-    def __set_range(self, mrange: float | None, nplc: float):
-        """Sets the range and NPLC."""
-        if mrange is None:
-            self.measurement_range = 'AUTO'
-        else:
-            self.measurement_range = f'{mrange:0.6f}'
-        self.nplc = nplc
+        self._reading_count = count
+        return _reading_burst_commands(count, interval)
+
+    def _preset_norm_commands(self):
+        """
+        Returns the commands applying the normal preset,
+        restoring the binary output format if it was requested.
+        """
+        self._reading_count = 1
+        self._output_format = 'SREAL' if self.binary_output else 'ASCII'
+        return _PRESET_NORM_BINARY if self.binary_output else _PRESET_NORM
 
     # --- Measurement Configuration Functions ---
     
     def reading_configuration(self, count=1, interval=None, source='HOLD', arm_source='AUTO'):
-        self.__set_reading_burst(count, interval)
-        self.__set_triggering(source, arm_source)
+        self.write_many(
+            self.__reading_burst_commands(count, interval)
+            + self.__triggering_commands(source, arm_source)
+        )
+
+    def store_subroutine(self, number: int, commands):
+        """
+        Stores commands in the meter as a subroutine (SUB ... SUBEND). Running it
+        with call_subroutine() costs a single short command, and the meter times
+        the whole sequence itself.
+        """
+        # Not coalesced: the commands are stored, not executed
+        self._write_commands([f'SUB {number}', *commands, 'SUBEND'])
+        self._subroutine_counts.pop(number, None)
+
+    def call_subroutine(self, number: int):
+        """
+        Runs a subroutine stored with store_subroutine(). The remembered
+        settings are forgotten, since the subroutine may change any of them.
+        """
+        self.write(f'CALL {number}')
+        count = self._subroutine_counts.get(number)
+        if count is not None:
+            self._reading_count = count
+
+    def store_burst_subroutine(self, number: int, count=1, interval=None, source='HOLD', arm_source='AUTO'):
+        """
+        Stores the burst and trigger setup of reading_configuration() as a subroutine,
+        so repeating it later with call_subroutine() is one command.
+        """
+        reading_count = self._reading_count
+        commands = self.__reading_burst_commands(count, interval) + self.__triggering_commands(source, arm_source)
+        # Applied when the subroutine is called, not when it is stored
+        self._reading_count = reading_count
+        self.store_subroutine(number, commands)
+        self._subroutine_counts[number] = count
     
-    def _common_configure(self, mrange, nplc, AutoZero=True, HiZ=False, OffsetCompensation=False):
-        self.write('NDIG 6')
-        self.__set_range(mrange, nplc)
-        self.auto_zero = 'ON' if AutoZero else 'OFF'
-        self.high_impedance = 'ON' if HiZ else 'OFF'
-        self.offset_compensation = 'ON' if OffsetCompensation else 'OFF'
+    def _configure(self, function, mrange, nplc, AutoZero=True, HiZ=False, OffsetCompensation=False):
+        """
+        Applies the normal preset, the function commands and the common settings
+        as one message, see _configuration_commands().
+        """
+        self._reading_count = 1
+        self._output_format = 'SREAL' if self.binary_output else 'ASCII'
+        self.write_many(_configuration_commands(
+            function, mrange, nplc, AutoZero, HiZ, OffsetCompensation, self.binary_output
+        ))
 
     def conf_function_DCV(self, mrange=None, nplc=1, AutoZero=True, HiZ=False):
         """Configures the meter to measure DCV. If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('DCV')
-        self._common_configure(mrange, nplc, AutoZero, HiZ)
+        self._configure(('DCV',), mrange, nplc, AutoZero, HiZ)
 
     def conf_function_DCI(self, mrange=None, nplc=1, AutoZero=True, HiZ=False):
         """Configures the meter to measure DCI. If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('DCI')
-        self._common_configure(mrange, nplc, AutoZero, HiZ)
+        self._configure(('DCI',), mrange, nplc, AutoZero, HiZ)
 
     def conf_function_ACV(self, mrange=None, nplc=1):
         """Configures the meter to measure ACV (True RMS). If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('ACV')
-        self.write('SETACV SYNC')
-        self._common_configure(mrange, nplc)
+        self._configure(('ACV', 'SETACV SYNC'), mrange, nplc)
 
     def conf_function_ACI(self, mrange=None, nplc=1):
         """Configures the meter to measure ACI. If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('ACI')
-        self._common_configure(mrange, nplc)
+        self._configure(('ACI',), mrange, nplc)
 
     def conf_function_OHM2W(self, mrange=None, nplc=1, AutoZero=True, OffsetCompensation=False):
         """Configures the meter to measure OHM2W. If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('OHM')
-        self._common_configure(mrange, nplc, AutoZero, OffsetCompensation)
+        self._configure(('OHM',), mrange, nplc, AutoZero, OffsetCompensation=OffsetCompensation)
 
     def conf_function_OHM4W(self, mrange=None, nplc=1, AutoZero=True, OffsetCompensation=False):
         """Configures the meter to measure OHM4W. If range=None the meter is set to Autorange."""
-        self.write('PRESET NORM')
-        self.write('OHMF')
-        self._common_configure(mrange, nplc, AutoZero, OffsetCompensation)
+        self._configure(('OHMF',), mrange, nplc, AutoZero, OffsetCompensation=OffsetCompensation)
 
     def conf_function_FREQ(self, mrange='AUTO', gate_time=1.0):
         """
@@ -230,25 +829,21 @@ class HP3458A(HPLegacyInstrument):
                                          Valid values: 1.0, 0.1, 0.01, 0.001, 0.0001.
                                          Defaults to 1.0.
         """
-        gate_time_map = {
-            1.0:    0.00001,  # 7 digits
-            0.1:    0.0001,   # 7 digits
-            0.01:   0.001,    # 6 digits
-            0.001:  0.01,     # 5 digits
-            0.0001: 0.1       # 4 digits
-        }
-        if gate_time not in gate_time_map:
-            raise ValueError(f"Invalid gate_time. Must be one of {list(gate_time_map.keys())}")
-            
-        resolution_param = gate_time_map[gate_time]
+        try:
+            resolution_param = _GATE_TIME_RESOLUTIONS[gate_time]
+        except KeyError:
+            raise ValueError(_INVALID_GATE_TIME) from None
+
         range_param = 'AUTO' if mrange == 'AUTO' else f'{mrange:0.6f}'
 
-        self.write('PRESET NORM')
-        # Use FSOURCE to define the signal type for frequency measurement (default is ACV)
-        self.write('FSOURCE ACV')
-        # Use the FUNC command for a concise setup
-        self.write(f'FUNC FREQ, {range_param}, {resolution_param}')
-        self.write('NDIG 6')  # Set number of digits to 6
+        self.write_many([
+            *self._preset_norm_commands(),
+            # Use FSOURCE to define the signal type for frequency measurement (default is ACV)
+            'FSOURCE ACV',
+            # Use the FUNC command for a concise setup
+            f'FUNC FREQ, {range_param}, {resolution_param}',
+            'NDIG 6',  # Set number of digits to 6
+        ])
 
     def conf_function_ACDCV(self, mrange=None, nplc=1, ac_bandwidth_low=20, HiZ=False):
         """
@@ -262,10 +857,7 @@ class HP3458A(HPLegacyInstrument):
                                               Defaults to 20.
             HiZ (bool, optional): Use high input impedance. Defaults to True.
         """
-        self.write('PRESET NORM')
-        self.write('ACDCV')
-        self.write(f'ACBAND {ac_bandwidth_low}')
-        self._common_configure(mrange, nplc, AutoZero=True, HiZ=HiZ)
+        self._configure(('ACDCV', f'ACBAND {ac_bandwidth_low}'), mrange, nplc, AutoZero=True, HiZ=HiZ)
 
     # TODO: Test this function.
     def conf_function_digitize(self, mode='DSDC', mrange=10, delay=0, num_samples=1024, sample_interval=100e-9):
@@ -284,11 +876,15 @@ class HP3458A(HPLegacyInstrument):
         if mode.upper() not in ['DSDC', 'DSAC']:
             raise ValueError("Mode must be 'DSDC' or 'DSAC'.")
         
-        self.write('PRESET DIG') # Use the digitizing preset
-        self.write(mode.upper())
-        self.measurement_range = f'{mrange:0.6f}'
+        # Use the digitizing preset
+        commands = ['PRESET DIG', mode.upper(), _range_command(mrange)]
         if delay > 0:
-            self.write(f'DELAY {delay}')
+            commands.append(f'DELAY {delay}')
         
         # SWEEP command sets the sample interval and number of samples
-        self.write(f'SWEEP {sample_interval}, {num_samples}')
+        commands.append(f'SWEEP {sample_interval}, {num_samples}')
+        # Transfer samples as binary doubles instead of ASCII
+        commands.append('OFORMAT DREAL')
+        self.write_many(commands)
+        self._output_format = 'DREAL'
+        self._reading_count = num_samples
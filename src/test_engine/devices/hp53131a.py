@@ -3,20 +3,26 @@ import time
 from pymeasure.instruments import Instrument, SCPIMixin
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
 
+from devices.base import TerminationMixin, disable_nagle
 
-class HP53131A(SCPIMixin, Instrument):
+
+class HP53131A(TerminationMixin, SCPIMixin, Instrument):
     """
     Represents the Hewlett-Packard 53131A Universal Counter.
     """
 
+    # SRQ poll delays in seconds of _wait_for_opc: the first one, doubled up to the last one
+    OPC_FIRST_POLL = 0.001
+    OPC_MAX_POLL = 0.1
+
     def __init__(self, adapter, name="Hewlett-Packard 53131A", **kwargs):
         super().__init__(
             adapter,
             name,
-            read_termination='\n',
-            write_termination='\n',
             **kwargs
         )
+        # LAN-GPIB gateways: send short commands without waiting for the previous ACK
+        disable_nagle(self.adapter)
         
     # Channel-specific configuration properties
     ch1_coupling = Instrument.control(
@@ -114,14 +120,17 @@ class HP53131A(SCPIMixin, Instrument):
         Waits for the previous operation to complete by polling the Service
         Request Queue (SRQ) for the Operation Complete (OPC) bit.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout_sec
+        delay = self.OPC_FIRST_POLL
         # *OPC command sets the OPC bit in the Standard Event Status Register
         # when all pending operations are finished.
         self.write('*OPC')
         while not self.adapter.connection.query_srq():
-            if time.time() - start_time > timeout_sec:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise TimeoutError("Timeout waiting for operation to complete.")
-            time.sleep(0.1)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.OPC_MAX_POLL)
         # Clear status registers after a successful wait to prepare for the next operation
         self.clear()
         
@@ -162,9 +171,9 @@ class HP53131A(SCPIMixin, Instrument):
         self.write(":ABORt")
 
     # --- Configuration Functions ---
-    def _set_input_coupling(self, channel: int, coupling: str):
+    def _input_coupling_command(self, channel: int, coupling: str) -> str:
         """
-        Sets the input coupling for a specified channel.
+        Builds the command that sets the input coupling for a specified channel.
 
         Args:
             channel (int): The input channel (1 or 2).
@@ -177,11 +186,15 @@ class HP53131A(SCPIMixin, Instrument):
         coupling_upper = coupling.upper()
         if coupling_upper not in ['AC', 'DC']:
             raise ValueError("Coupling must be 'AC' or 'DC'.")
-        self.write(f':INP{channel}:COUP {coupling_upper}')
+        return f':INP{channel}:COUP {coupling_upper}'
 
-    def _set_attenuation(self, channel: int, attenuation_x: int):
+    def _set_input_coupling(self, channel: int, coupling: str):
+        """Sets the input coupling for a specified channel."""
+        self.write(self._input_coupling_command(channel, coupling))
+
+    def _attenuation_command(self, channel: int, attenuation_x: int) -> str:
         """
-        Sets the input attenuation for a specified channel.
+        Builds the command that sets the input attenuation for a specified channel.
         
         Args:
             channel: The input channel (1 or 2).
@@ -193,15 +206,24 @@ class HP53131A(SCPIMixin, Instrument):
             raise ValueError("Channel must be 1 or 2.")
         if attenuation_x not in [1, 10]:
             raise ValueError("Attenuation must be 1 or 10.")
-        self.write(f':INP{channel}:ATT {attenuation_x}')
+        return f':INP{channel}:ATT {attenuation_x}'
 
-    def _set_trigger_level_volts(self, channel: int, level: float):
+    def _set_attenuation(self, channel: int, attenuation_x: int):
+        """Sets the input attenuation for a specified channel."""
+        self.write(self._attenuation_command(channel, attenuation_x))
+
+    def _trigger_level_volts_command(self, channel: int, level: float) -> str:
         """
-        Sets the trigger level to an absolute voltage. This disables auto-trigger.
+        Builds the command that sets the trigger level to an absolute voltage.
+        This disables auto-trigger.
         """
         if channel not in [1, 2]:
             raise ValueError("Channel must be 1 or 2.")
-        self.write(f':SENS:EVEN{channel}:LEV:ABS {level}')
+        return f':SENS:EVEN{channel}:LEV:ABS {level}'
+
+    def _set_trigger_level_volts(self, channel: int, level: float):
+        """Sets the absolute trigger level for a specified channel."""
+        self.write(self._trigger_level_volts_command(channel, level))
 
     def get_trigger_level_volts(self, channel: int) -> float:
         """
@@ -241,9 +263,9 @@ class HP53131A(SCPIMixin, Instrument):
         self.write(f':SENS:EVEN{channel}:LEV:AUTO ON')
         self.write(f':SENS:EVEN{channel}:LEV:REL {percent}')
 
-    def _set_event_slope(self, channel: int, edge: str):
+    def _event_slope_command(self, channel: int, edge: str) -> str:
         """
-        Sets the trigger slope for a specified event channel.
+        Builds the command that sets the trigger slope for a specified event channel.
 
         Args:
             channel (int): The event channel (1 or 2).
@@ -256,7 +278,11 @@ class HP53131A(SCPIMixin, Instrument):
         edge_upper = edge.upper()
         if edge_upper not in ['POS', 'NEG']:
             raise ValueError("Edge must be 'POS' or 'NEG'.")
-        self.write(f':SENS:EVEN{channel}:SLOP {edge_upper}')
+        return f':SENS:EVEN{channel}:SLOP {edge_upper}'
+
+    def _set_event_slope(self, channel: int, edge: str):
+        """Sets the trigger slope for a specified channel."""
+        self.write(self._event_slope_command(channel, edge))
 
     def _set_time_interval_input_mode(self, mode: str):
         """
@@ -297,10 +323,13 @@ class HP53131A(SCPIMixin, Instrument):
             stop_edge: The stop edge for time interval measurements ('POS' or 'NEG').
             attenuation_x: The input attenuation factor (1 or 10).
         """
-        self._set_input_coupling(channel, coupling)
-        self._set_event_slope(channel, slope)
-        self._set_attenuation(channel, attenuation_x)
-        self._set_trigger_level_volts(channel, trigger_level)
+        # Sent as one compound SCPI message to save bus round-trips
+        self.write(';'.join([
+            self._input_coupling_command(channel, coupling),
+            self._event_slope_command(channel, slope),
+            self._attenuation_command(channel, attenuation_x),
+            self._trigger_level_volts_command(channel, trigger_level),
+        ]))
 
     # --- Measurement Functions ---
 
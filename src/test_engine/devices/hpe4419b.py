@@ -2,8 +2,10 @@ import time
 
 from pymeasure.instruments import Instrument
 
+from devices.base import TerminationMixin, disable_nagle
 
-class HPE4419B(Instrument):
+
+class HPE4419B(TerminationMixin, Instrument):
     """
     Driver for the Agilent/HP E4419B Power Meter.
     
@@ -11,14 +13,18 @@ class HPE4419B(Instrument):
     power measurements on one or two channels.
     """
 
+    # SRQ poll delays in seconds of _wait_for_opc: the first one, doubled up to the last one
+    OPC_FIRST_POLL = 0.001
+    OPC_MAX_POLL = 0.1
+
     def __init__(self, adapter, name="Hewlett-Packard E4419B", **kwargs):
         super().__init__(
             adapter,
             name,
-            read_termination='\n',
-            write_termination='\n',
             **kwargs
         )
+        # LAN-GPIB gateways: send short commands without waiting for the previous ACK
+        disable_nagle(self.adapter)
     
     def setup(self):
         """
@@ -57,14 +63,17 @@ class HPE4419B(Instrument):
         
         This requires the adapter to have a `query_srq()` method.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout_sec
+        delay = self.OPC_FIRST_POLL
         # *OPC command enables the OPC bit in the Standard Event Status Register
         # to be set when all pending operations are finished.
         self.write('*OPC')
         while not self.adapter.query_srq():
-            if time.time() - start_time > timeout_sec:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise TimeoutError("Timeout waiting for operation to complete.")
-            time.sleep(0.1)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.OPC_MAX_POLL)
         # Clear status registers after a successful wait to prepare for the next operation
         self.clear_status()
 
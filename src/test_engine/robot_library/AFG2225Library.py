@@ -19,6 +19,7 @@ class AFG2225Library(BaseLibrary):
     def __init__(self):
         super().__init__()
         self.device = None
+        self._channels = {}
 
     def get_id(self) -> str:
         """Returns the device identification string."""
@@ -32,8 +33,10 @@ class AFG2225Library(BaseLibrary):
         | Open Connection | ASRL5::INSTR |
         """
         resource = f'ASRL{address}::INSTR'
+        self._channels.clear()
         self.device = AFG2225(resource, **kwargs)
         logger.info(f"Connected to AFG2225 at {resource}")
+        self._check_transport()
         self.device.setup()
 
     def close_connection(self):
@@ -41,89 +44,115 @@ class AFG2225Library(BaseLibrary):
         Closes the instrument connection.
         """
         if self.device:
-            self.device.adapter.connection.close()
-            self.device = None
+            try:
+                self.device.adapter.connection.close()
+            finally:
+                self.device = None
+                self._channels.clear()
             logger.info("Connection closed from AFG2225.")
 
+    def _channel(self, channel):
+        """Returns the channel object of the device, caching the lookup."""
+        channel_obj = self._channels.get(channel)
+        if channel_obj is None:
+            channel_obj = getattr(self.device, f"ch{channel}")
+            self._channels[channel] = channel_obj
+        return channel_obj
+
     # ------------------ CHANNEL CONTROL ------------------
+    @publish_status
+    def configure_channel(self, channel, shape=None, frequency=None, amplitude=None, offset=None, phase=None):
+        """
+        Sets several channel settings in one command. Omitted settings are not changed.
+        Example:
+        | Configure Channel | 1 | shape=sine | frequency=1000 | amplitude=2 |
+        """
+        self._channel(channel).configure(
+            shape=shape,
+            frequency=None if frequency is None else float(frequency),
+            amplitude=None if amplitude is None else float(amplitude),
+            offset=None if offset is None else float(offset),
+            phase=None if phase is None else float(phase),
+        )
+
     @publish_status
     def set_channel_shape(self, channel, shape):
         """Sets waveform shape: sine, square, ramp, pulse, noise, user."""
-        getattr(self.device, f"ch{channel}").shape = shape
+        self._channel(channel).shape = shape
 
     def get_channel_shape(self, channel):
         """Returns current waveform shape of a channel."""
-        return getattr(self.device, f"ch{channel}").shape
+        return self._channel(channel).shape
 
     @publish_status
     def set_channel_frequency(self, channel, freq):
         """Sets channel frequency in Hz."""
-        getattr(self.device, f"ch{channel}").frequency = float(freq)
+        self._channel(channel).frequency = float(freq)
 
     def get_channel_frequency(self, channel):
         """Returns channel frequency in Hz."""
-        return getattr(self.device, f"ch{channel}").frequency
+        return self._channel(channel).frequency
 
     @publish_status
     def set_channel_amplitude(self, channel, amplitude):
         """Sets channel amplitude in Vpp."""
-        getattr(self.device, f"ch{channel}").amplitude = float(amplitude)
+        self._channel(channel).amplitude = float(amplitude)
 
     def get_channel_amplitude(self, channel):
         """Returns channel amplitude in Vpp."""
-        return getattr(self.device, f"ch{channel}").amplitude
+        return self._channel(channel).amplitude
 
     def set_channel_offset(self, channel, offset):
         """Sets DC offset in volts."""
-        getattr(self.device, f"ch{channel}").offset = float(offset)
+        self._channel(channel).offset = float(offset)
 
     def get_channel_offset(self, channel):
         """Returns DC offset in volts."""
-        return getattr(self.device, f"ch{channel}").offset
+        return self._channel(channel).offset
 
     def set_channel_phase(self, channel, phase):
         """Sets phase in degrees."""
-        getattr(self.device, f"ch{channel}").phase = float(phase)
+        self._channel(channel).phase = float(phase)
 
     def get_channel_phase(self, channel):
         """Returns channel phase in degrees."""
-        return getattr(self.device, f"ch{channel}").phase
+        return self._channel(channel).phase
 
     def enable_channel_output(self, channel):
         """Turns ON channel output."""
-        getattr(self.device, f"ch{channel}").output_enabled = True
+        self._channel(channel).output_enabled = True
 
     def disable_channel_output(self, channel):
         """Turns OFF channel output."""
-        getattr(self.device, f"ch{channel}").output_enabled = False
+        self._channel(channel).output_enabled = False
 
     def is_channel_output_enabled(self, channel):
         """Checks if channel output is ON."""
-        return getattr(self.device, f"ch{channel}").output_enabled
+        return self._channel(channel).output_enabled
 
     def set_channel_load(self, channel, load):
         """Sets output load: '50ohm' or 'highZ'."""
-        getattr(self.device, f"ch{channel}").load = load
+        self._channel(channel).load = load
 
     def get_channel_load(self, channel):
         """Returns channel load."""
-        return getattr(self.device, f"ch{channel}").load
+        return self._channel(channel).load
 
     def set_channel_duty_cycle(self, channel, duty):
         """Sets duty cycle (%) for square wave."""
-        getattr(self.device, f"ch{channel}").duty_cycle = float(duty)
+        self._channel(channel).duty_cycle = float(duty)
 
     def get_channel_duty_cycle(self, channel):
         """Returns duty cycle (%) for square wave."""
-        return getattr(self.device, f"ch{channel}").duty_cycle
+        return self._channel(channel).duty_cycle
 
     def set_channel_ramp_symmetry(self, channel, symmetry):
         """Sets ramp symmetry (%) for ramp waveforms."""
-        getattr(self.device, f"ch{channel}").ramp_symmetry = float(symmetry)
+        self._channel(channel).ramp_symmetry = float(symmetry)
 
     def get_channel_ramp_symmetry(self, channel):
         """Returns ramp symmetry (%) for ramp waveforms."""
-        return getattr(self.device, f"ch{channel}").ramp_symmetry
+        return self._channel(channel).ramp_symmetry
 
     # ------------------ INSTRUMENT LEVEL ------------------
     def reset_instrument(self):
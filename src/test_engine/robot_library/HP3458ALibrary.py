@@ -1,4 +1,7 @@
 import logging
+import functools
+
+import numpy as np
 
 from devices import HP3458A
 from robot_library.base import BaseLibrary, publish_result, measure
@@ -7,6 +10,12 @@ from robot_library.base import BaseLibrary, publish_result, measure
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _normalize(token: str) -> str:
+    """Upper-cases a keyword argument such as 'on' or 'sgl', caching the result."""
+    return token.upper()
+
+
 class HP3458ALibrary(BaseLibrary):
     """
     Robot Framework library wrapper for controlling the HP 3458A Multimeter.
@@ -19,24 +28,29 @@ class HP3458ALibrary(BaseLibrary):
         self.device = None
 
     # ------------------ CONNECTION ------------------
-    def open_connection(self, address, **kwargs):
+    def open_connection(self, address, use_binary: bool = False, **kwargs):
         """
         Opens connection to the HP3458A.
+        With `use_binary` the readings are transferred as SREAL binary values, see `Setup Device`.
         Example:
         | Open Connection | GPIB0::2::INSTR |
+        | Open Connection | GPIB0::2::INSTR | use_binary=True |
         """
         resource = f'GPIB0::{address}::INSTR'
         self.device = HP3458A(resource, **kwargs)
         logger.info(f"Connected to HP3458A at {resource}")
-        self.device.setup()
+        self._check_transport()
+        self.device.setup(use_binary)
 
     def close_connection(self):
         """
         Closes the instrument connection.
         """
         if self.device:
-            self.device.adapter.connection.close()
-            self.device = None
+            try:
+                self.device.adapter.connection.close()
+            finally:
+                self.device = None
             logger.info("Connection closed from HP3458A.")
 
     # --- Identification & System Status ---
@@ -53,9 +67,14 @@ class HP3458ALibrary(BaseLibrary):
         """Resets the device to default state."""
         self.device.reset()
 
-    def setup_device(self):
-        """Performs basic setup (END ALWAYS, TRIG HOLD)."""
-        self.device.setup()
+    def setup_device(self, use_binary: bool = False):
+        """
+        Performs basic setup (END ALWAYS, TRIG HOLD).
+        With `use_binary` the readings are transferred as SREAL binary values.
+        Example:
+        | Setup Device | use_binary=True |
+        """
+        self.device.setup(use_binary)
 
     def beep(self):
         """Beeps the device."""
@@ -77,33 +96,53 @@ class HP3458ALibrary(BaseLibrary):
         Triggers a single reading and returns the value.
         Returns a list if multiple readings are returned.
         """
-        return self.device.get_reading(trig)
+        reading = self.device.get_reading(trig)
+        if isinstance(reading, np.ndarray):
+            return reading.tolist()
+        return reading
+
+    async def get_reading_async(self, trig: bool = True):
+        """
+        Same as `Get Reading`, but can run concurrently with readings
+        from instruments that do not share the same GPIB bus.
+        Only faster when awaited together with other keywords (asyncio.gather),
+        since Robot Framework runs test case keywords one at a time.
+        """
+        return await self._run_async(self.get_reading, trig)
+
+    def acquire_burst(self, count: int, interval: float = None, timeout: float = 10.0) -> list:
+        """
+        Takes `count` readings timed by the meter and returns them as a list.
+        Example:
+        | ${readings} = | Acquire Burst | 1000 | interval=0.001 |
+        """
+        return self.device.acquire_burst(int(count), interval, timeout).tolist()
 
     # --- Configuration Controls ---
 
     def set_auto_zero(self, state: str):
         """Sets Auto Zero ON or OFF."""
-        self.device.auto_zero = state.upper()
+        self.device.auto_zero = _normalize(state)
 
     def set_high_impedance(self, state: str):
         """Sets High Impedance ON or OFF (DC Voltage only)."""
-        self.device.high_impedance = state.upper()
+        self.device.high_impedance = _normalize(state)
 
     def set_offset_compensation(self, state: str):
         """Sets Offset Compensation ON or OFF (Resistance only)."""
-        self.device.offset_compensation = state.upper()
+        self.device.offset_compensation = _normalize(state)
 
     def set_low_pass_filter(self, state: str):
         """Sets Low Pass Filter ON or OFF."""
-        self.device.low_pass_filter = state.upper()
+        self.device.low_pass_filter = _normalize(state)
 
     def set_trigger_source(self, source: str):
         """Sets Trigger Source (SGL, EXT, HOLD)."""
-        self.device.trigger_source = source.upper()
+        self.device.trigger_source = _normalize(source)
 
     def set_arm_source(self, source: str):
         """Sets Arm Source (AUTO, SGL, EXT, HOLD)."""
-        self.device.arm_source = source.upper()
+        self.device.arm_source = _normalize(source)
 
     def set_burst_interval(self, interval: float):
         """Sets burst interval between readings (seconds)."""
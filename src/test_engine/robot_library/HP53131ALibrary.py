@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from devices import HP53131A
 from robot_library.base import BaseLibrary, publish_result, measure
 
@@ -28,6 +30,7 @@ class HP53131ALibrary(BaseLibrary):
         resource = f'GPIB0::{address}::INSTR'
         self.device = HP53131A(resource, **kwargs)
         logger.info(f"Connected to HP53131A at {resource}")
+        self._check_transport()
         self.device.setup()
 
     def close_connection(self):
@@ -35,8 +38,10 @@ class HP53131ALibrary(BaseLibrary):
         Closes the instrument connection.
         """
         if self.device:
-            self.device.adapter.connection.close()
-            self.device = None
+            try:
+                self.device.adapter.connection.close()
+            finally:
+                self.device = None
             logger.info("Connection closed from HP53131A.")
 
     # --- Identification and Status ---
@@ -124,10 +129,29 @@ class HP53131ALibrary(BaseLibrary):
         """Initiates measurement, waits, and fetches the result."""
         return self.device.initiate_wait_fetch(timeout)
 
+    async def initiate_wait_and_fetch_async(self, timeout: int = 10) -> float:
+        """
+        Same as `Initiate Wait And Fetch`, but can run concurrently with
+        instruments that do not share the same GPIB bus.
+        Only faster when awaited together with other keywords (asyncio.gather),
+        since Robot Framework runs test case keywords one at a time.
+        """
+        return await self._run_async(self.initiate_wait_and_fetch, timeout)
+
     def fetch_average_result(self) -> float:
         """Fetches an averaged measurement result."""
         return self.device.fetch_average()
 
+    def fetch_average_result_fast(self, count: int = 10, timeout: int = 10) -> float:
+        """
+        Takes `count` single measurements and averages them on the host.
+        Faster than instrument-side averaging when the gate time is short.
+        """
+        readings = np.empty(int(count), dtype=np.float64)
+        for i in range(readings.size):
+            readings[i] = self.device.initiate_wait_fetch(timeout)
+        return float(readings.mean())
+
     # --- Totalizer ---
 
     def measure_totalize(self):
@@ -1,11 +1,27 @@
 import os
 import redis
 import json
+import asyncio
 import functools
+import weakref
 
+from pyvisa.constants import InterfaceType
 from robot.api.deco import library
 
 
+# One lock per shared bus (e.g. a GPIB board) so async keywords
+# on instruments sharing it do not contend for the bus. An asyncio.Lock
+# belongs to one event loop, so the locks are kept per running loop.
+# Event loop -> {bus id: lock}
+_BUS_LOCKS = weakref.WeakKeyDictionary()
+
+
+def _bus_lock(bus_id: str) -> asyncio.Lock:
+    """Returns the lock of a shared bus for the running event loop."""
+    locks = _BUS_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(bus_id, asyncio.Lock())
+
+
 @library(scope='GLOBAL', auto_keywords=True)
 class BaseLibrary:
     NAME: str = 'unknown_device'
@@ -17,6 +33,8 @@ class BaseLibrary:
         self.measure_type_status = 'unknown'
         self.measure_unit_status = 'unknown'
         self.connected = False
+        self.concurrent_ok = False
+        self._bus_id = None
         self._r = redis.Redis(host=os.getenv('REDIS_HOST', 'localhost'), port=os.getenv('REDIS_PORT', 6379), decode_responses=True)
         try:
             self._r.ping()
@@ -36,6 +54,42 @@ class BaseLibrary:
                 [{'value': result, 'value_type': self.measure_type_status, 'value_unit': self.measure_unit_status}],    
             ]
     
+    def _check_transport(self):
+        """
+        Checks whether the device transport can be queried concurrently with other
+        instruments. Must be called by subclasses once the device is connected.
+        """
+        adapter = self.device.adapter
+        connection = getattr(adapter, 'connection', None)
+        if connection is None:
+            # Custom ProtocolAdapter
+            self.concurrent_ok = getattr(adapter, 'supports_concurrent', False)
+            self._bus_id = str(getattr(adapter, 'host', adapter.address))
+        else:
+            # pymeasure VISAAdapter
+            self.concurrent_ok = connection.interface_type != InterfaceType.gpib
+            self._bus_id = connection.resource_name.split('::')[0]
+
+    async def _run_async(self, func, *args, **kwargs):
+        """
+        Runs a blocking call in a worker thread. Calls on transports sharing a bus
+        are serialized with the other instruments on that bus.
+
+        Robot Framework runs keywords one at a time, so the async keywords built on
+        this are no faster than the blocking ones when called from a test case.
+        They only overlap instruments when awaited together, e.g. with
+        asyncio.gather() from a Python keyword or script.
+        """
+        if self.concurrent_ok:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        async with _bus_lock(self._bus_id):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    @functools.cached_property
+    def _channel_attributes(self) -> tuple[str, ...]:
+        """Names of the device channel attributes ('ch1', 'ch2', ...), built on first use."""
+        return tuple(f'ch{ch + 1}' for ch in range(self.CHANNELS))
+
     def open_connection(self, address: int, **kwargs):
         raise NotImplementedError("This method should be implemented by subclasses.")
     
@@ -59,8 +113,10 @@ def publish_status(func):
     def wrapper(self: BaseLibrary, *args, **kwargs):
         result = func(self, *args, **kwargs)
         status = [[] for _ in range(self.CHANNELS)]
-        for ch in range(self.CHANNELS):
-            channel_obj = getattr(self.device, f'ch{ch+1}')
+        for ch, attribute in enumerate(self._channel_attributes):
+            # Drivers caching read-back values (e.g. AFG2225) clear them on every write,
+            # so a status published after a setting still shows what the instrument applied
+            channel_obj = getattr(self.device, attribute)
             status[ch].append({
                 'value': channel_obj.frequency,
                 'value_type': 'frequency',
@@ -89,12 +145,16 @@ def measure(type: str, unit: str):
         type (str): What the device is measuring? (e.g frequency, voltage)
         unit (str): The unit of the data (e.g Hz, Volt)
     """
+    # Normalized once when the keyword is decorated, not on every call
+    type_status = type.lower()
+    unit_status = unit.lower()
+
     def inner(func):
         @functools.wraps(func)
         def wrapper(self: BaseLibrary, *args, **kwargs):
             result = func(self, *args, **kwargs)
-            self.measure_type_status = type.lower()
-            self.measure_unit_status = unit.lower()
+            self.measure_type_status = type_status
+            self.measure_unit_status = unit_status
             return result
         return wrapper
     return inner
\ No newline at end of file
@@ -4,6 +4,8 @@ from robot.parsing.model.statements import KeywordCall, Documentation, LibraryIm
 
 
 class MyKeyword:
+    __slots__ = ('name', 'lineno')
+
     def __init__(self, name: str, lineno: int):
         self.name = name
         self.lineno = lineno
@@ -16,6 +18,8 @@ class MyKeyword:
 
 
 class MyTestCase:
+    __slots__ = ('name', 'lineno', 'keywords', 'documentation')
+
     def __init__(self, name: str, lineno: int):
         self.name = name
         self.lineno = lineno
@@ -32,6 +36,8 @@ class MyTestCase:
 
 
 class MyTestSuite:
+    __slots__ = ('name', 'libraries', 'testcases')
+
     def __init__(self, name: str):
         self.name = name
         self.libraries: list[str] = []
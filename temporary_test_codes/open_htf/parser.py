@@ -1,13 +1,85 @@
 import os
+import copy
+import mmap
+import stat
 import json
+import functools
+
 import yaml
 import jsonschema
 
+try:
+    # libyaml C loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(data) -> dict:
+        return json.loads(bytes(data))
+
+
+def _mtime(file_path: str, error_message: str) -> float:
+    """
+    Returns the modification time of a regular file, with a single stat call.
+
+    Raises:
+        FileNotFoundError: With `error_message` if the path is missing or not a file.
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(error_message) from None
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(error_message)
+    return st.st_mtime
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml(file_path: str, mtime: float) -> dict:
+    """Parses a YAML file, cached per path and modification time."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # The parser reads straight from the mapped file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json(file_path: str, mtime: float) -> dict:
+    """Parses a JSON file, cached per path and modification time."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # A zero-length file cannot be mapped, and is no valid JSON either
+            raise json.JSONDecodeError('Expecting value', '', 0)
+        # orjson parses the mapped file in place, without copying it to bytes first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _json_loads(view)
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_validator(schema_path: str, mtime: float):
+    """
+    Builds a validator for a JSON schema file, cached per path and modification time.
+    The schema itself is checked only once, when the validator is built.
+    """
+    schema = _load_json(schema_path, mtime)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
 
 def read_test_file(file_path: str) -> dict:
     """
     Read and parse a YAML test file.
 
+    The parsed data is cached until the file changes. Each call returns
+    its own copy, so callers may modify it.
+
     Args:
         file_path (str): Path to the YAML file.
 
@@ -18,11 +90,8 @@ def read_test_file(file_path: str) -> dict:
         FileNotFoundError: If the file does not exist.
         yaml.YAMLError: If the YAML content is invalid.
     """
-    if not os.path.isfile(file_path):
-        raise FileNotFoundError(f'test file not found: {file_path}')
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-    return data
+    mtime = _mtime(file_path, f'test file not found: {file_path}')
+    return copy.deepcopy(_load_yaml(file_path, mtime))
 
 
 def _read_schema_file(schema_path: str) -> dict:
@@ -39,11 +108,8 @@ def _read_schema_file(schema_path: str) -> dict:
         FileNotFoundError: If the schema file does not exist.
         json.JSONDecodeError: If the JSON content is invalid.
     """
-    if not os.path.isfile(schema_path):
-        raise FileNotFoundError(f'Schema file not found: {schema_path}')
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        schema = json.load(f)
-    return schema
+    mtime = _mtime(schema_path, f'Schema file not found: {schema_path}')
+    return copy.deepcopy(_load_json(schema_path, mtime))
 
 
 def parse_test_file(file_path, schema_path) -> dict:
@@ -64,6 +130,7 @@ def parse_test_file(file_path, schema_path) -> dict:
         jsonschema.ValidationError: If the test does not match the schema.
     """
     data = read_test_file(file_path)
-    schema = _read_schema_file(schema_path)
-    jsonschema.validate(data, schema)
+    mtime = _mtime(schema_path, f'Schema file not found: {schema_path}')
+    validator = _schema_validator(schema_path, mtime)
+    validator.validate(data)
     return data
\ No newline at end of file
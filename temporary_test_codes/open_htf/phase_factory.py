@@ -1,3 +1,4 @@
+import logging
 from typing import Callable
 
 import openhtf as htf
@@ -6,6 +7,9 @@ from openhtf.util import units
 from devices import Instrument
 
 
+logger = logging.getLogger(__name__)
+
+
 def phase_factory(step_config: dict, instrument: Instrument) -> Callable:
     """
     Generate an OpenHTF test phase function from a step configuration and instrument.
@@ -17,22 +21,21 @@ def phase_factory(step_config: dict, instrument: Instrument) -> Callable:
     Returns:
         Callable: An OpenHTF-compatible test phase function, optionally decorated with measurement configuration.
     """
+    # Resolve everything the phase needs once, instead of on every execution.
+    func_name = step_config['function']
+    params = step_config.get('params', {})
+    comment = step_config['comment']
+    instrument_method = getattr(instrument, func_name)
+    measurement_name = step_config['measurement']['name'] if 'measurement' in step_config else None
+
     def dynamic_phase(test):
         """The actual phase logic that will be executed."""
-        # Get the instrument function name and parameters from the config.
-        func_name = step_config['function']
-        params = step_config.get('params', {})
-
-        # Get the corresponding method from our instrument plug.
-        instrument_method = getattr(instrument, func_name)
-
         # Execute the instrument method.
         result = instrument_method(**params)
-        print(f"PHASE '{step_config['comment']}': Executed '{func_name}', got result: {result}")
+        logger.debug("PHASE '%s': Executed '%s', got result: %s", comment, func_name, result)
 
         # If this step includes a measurement, record it.
-        if 'measurement' in step_config:
-            measurement_name = step_config['measurement']['name']
+        if measurement_name is not None:
             test.measurements[measurement_name] = result
 
     # Set a descriptive name for the phase function for better logging.
@@ -50,7 +53,7 @@ def phase_factory(step_config: dict, instrument: Instrument) -> Callable:
             if hasattr(units, unit_name):
                 measurement.with_units(getattr(units, unit_name))
             else:
-                print(f"Warning: Unit '{unit_name}' not found.")
+                logger.warning("Unit '%s' not found.", unit_name)
 
         # Dynamically add validators.
         if 'validators' in meas_config:
@@ -0,0 +1,170 @@
+"""
+Pins the exact command strings the HP3458A driver sends, without an instrument.
+Run from the repository root with:
+| PYTHONPATH=src/test_engine python -m pytest temporary_test_codes/test_hp3458a_protocol.py
+"""
+import numpy as np
+import pytest
+from pymeasure.test import expected_protocol
+
+from devices import HP3458A
+
+
+DCV_10V = 'PRESET NORM;DCV;NDIG 6;RANGE 10;NPLC 1.000000;AZERO ON;FIXEDZ OFF;OCOMP OFF'
+
+
+def test_setup():
+    with expected_protocol(HP3458A, [('END ALWAYS;TRIG HOLD', None)]) as meter:
+        meter.setup()
+
+
+def test_setup_binary():
+    with expected_protocol(
+        HP3458A,
+        [('END ALWAYS;TRIG HOLD;OFORMAT SREAL;MFORMAT SREAL;MEM FIFO', None)],
+    ) as meter:
+        meter.setup(use_binary=True)
+
+
+def test_setup_without_batch_commands():
+    with expected_protocol(
+        HP3458A,
+        [('END ALWAYS', None), ('TRIG HOLD', None)],
+        batch_commands=False,
+    ) as meter:
+        meter.setup()
+
+
+def test_conf_function_DCV():
+    with expected_protocol(HP3458A, [(DCV_10V, None)]) as meter:
+        meter.conf_function_DCV(10, 1)
+
+
+def test_conf_function_DCV_autorange():
+    with expected_protocol(
+        HP3458A,
+        [('PRESET NORM;DCV;NDIG 6;RANGE AUTO;NPLC 10.000000;AZERO OFF;FIXEDZ ON;OCOMP OFF', None)],
+    ) as meter:
+        meter.conf_function_DCV(None, 10, AutoZero=False, HiZ=True)
+
+
+def test_conf_function_DCV_small_range():
+    with expected_protocol(
+        HP3458A,
+        [('PRESET NORM;DCV;NDIG 6;RANGE 1e-07;NPLC 1.000000;AZERO ON;FIXEDZ OFF;OCOMP OFF', None)],
+    ) as meter:
+        meter.conf_function_DCV(1e-7, 1)
+
+
+def test_conf_function_OHM4W_offset_compensation():
+    with expected_protocol(
+        HP3458A,
+        [('PRESET NORM;OHMF;NDIG 6;RANGE 1000;NPLC 1.000000;AZERO ON;FIXEDZ OFF;OCOMP ON', None)],
+    ) as meter:
+        meter.conf_function_OHM4W(1000, 1, OffsetCompensation=True)
+
+
+def test_repeated_nplc_is_written_once():
+    with expected_protocol(
+        HP3458A,
+        [(DCV_10V, None), ('NPLC 10.000000', None)],
+    ) as meter:
+        meter.conf_function_DCV(10, 1)
+        # Same as the configuration
+        meter.nplc = 1
+        meter.nplc = 10
+        meter.nplc = 10
+
+
+def test_repeated_configuration_is_written_again_after_preset():
+    with expected_protocol(HP3458A, [(DCV_10V, None), (DCV_10V, None)]) as meter:
+        meter.conf_function_DCV(10, 1)
+        meter.conf_function_DCV(10, 1)
+
+
+def test_split_commands_are_coalesced():
+    with expected_protocol(
+        HP3458A,
+        [('NPLC 10;AZERO OFF', None), ('AZERO ON', None)],
+    ) as meter:
+        meter.write('NPLC 10;AZERO OFF')
+        meter.write('NPLC 10;AZERO ON')
+
+
+def test_invalidate_cache_resends_settings():
+    with expected_protocol(
+        HP3458A,
+        [('NPLC 10.000000', None), ('NPLC 10.000000', None)],
+    ) as meter:
+        meter.nplc = 10
+        meter.invalidate_cache()
+        meter.nplc = 10
+
+
+def test_batched():
+    with expected_protocol(
+        HP3458A,
+        [('NPLC 10.000000;TARM AUTO', None)],
+    ) as meter:
+        with meter.batched():
+            meter.nplc = 1
+            meter.nplc = 10
+            meter.arm_source = 'AUTO'
+
+
+def test_batched_keeps_only_the_last_configuration():
+    with expected_protocol(
+        HP3458A,
+        [('PRESET NORM;ACV;SETACV SYNC;NDIG 6;RANGE 1;NPLC 1.000000;AZERO ON;FIXEDZ OFF;OCOMP OFF;TRIG SGL', None)],
+    ) as meter:
+        with meter.batched():
+            meter.conf_function_DCV(10, 1)
+            meter.conf_function_ACV(1, 1)
+            meter.trigger()
+
+
+def test_batched_sends_before_reading():
+    with expected_protocol(
+        HP3458A,
+        [('NPLC 10.000000;TRIG SGL', '1.5'), ('AZERO OFF', None)],
+    ) as meter:
+        with meter.batched():
+            meter.nplc = 10
+            assert meter.get_reading() == 1.5
+            meter.auto_zero = 'OFF'
+
+
+def test_batched_drops_commands_on_error():
+    with expected_protocol(HP3458A, [('NPLC 10.000000', None)]) as meter:
+        with pytest.raises(RuntimeError):
+            with meter.batched():
+                meter.nplc = 10
+                raise RuntimeError
+        # The dropped NPLC is not remembered as written
+        meter.nplc = 10
+
+
+def test_get_reading():
+    with expected_protocol(HP3458A, [('TRIG SGL', '-1.234567E-3')]) as meter:
+        assert meter.get_reading() == pytest.approx(-1.234567e-3)
+
+
+def test_conf_function_digitize():
+    samples = np.array([0.5, -0.25, 1.0, 2.0], dtype='>f8')
+    with expected_protocol(
+        HP3458A,
+        [
+            ('PRESET DIG;DSDC;RANGE 10;SWEEP 1e-07, 4;OFORMAT DREAL', None),
+            ('TRIG SGL', samples.tobytes()),
+        ],
+    ) as meter:
+        meter.conf_function_digitize('DSDC', 10, num_samples=4)
+        np.testing.assert_array_equal(meter.get_reading(), samples)
+
+
+def test_conf_function_digitize_with_delay():
+    with expected_protocol(
+        HP3458A,
+        [('PRESET DIG;DSAC;RANGE 1;DELAY 0.001;SWEEP 2e-05, 100;OFORMAT DREAL', None)],
+    ) as meter:
+        meter.conf_function_digitize('DSAC', 1, delay=0.001, num_samples=100, sample_interval=20e-6)